@@ -2,10 +2,12 @@
 EXIF Date Analyzer - Core module for analyzing and extracting date information from media files.
 """
 
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Iterator, List, Optional, Union
 
 import exifread
 from PIL import Image
@@ -43,14 +45,14 @@ class ExifAnalyzer:
     """Main class for analyzing EXIF data and extracting date information."""
     
     # Supported file extensions
-    IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.tiff', '.tif', '.png', '.bmp', '.gif', '.webp', '.heic', '.heif'}
-    VIDEO_EXTENSIONS = {'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp', '.mts', '.m2ts'}
+    IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.tiff', '.tif', '.png', '.bmp', '.gif', '.webp', '.heic', '.heif'})
+    VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.wmv', '.flv', '.webm', '.m4v', '.3gp', '.mts', '.m2ts'})
     
     # Reliable date sources for suggestions
-    RELIABLE_SOURCES = {'EXIF DateTimeOriginal', 'EXIF DateCreated', 'EXIF DateTimeDigitized', 'Filename Date'}
+    RELIABLE_SOURCES = frozenset({'EXIF DateTimeOriginal', 'EXIF DateCreated', 'EXIF DateTimeDigitized', 'Filename Date'})
     
-    # Date patterns commonly found in filenames
-    DATE_PATTERNS = [
+    # Date patterns commonly found in filenames, compiled once for all files
+    DATE_PATTERNS = [re.compile(pattern) for pattern in (
         # Date and time patterns
         r'(\d{4})[-_](\d{2})[-_](\d{2})[-_](\d{2})[-_](\d{2})[-_](\d{2})',  # YYYY-MM-DD-HH-MM-SS or YYYY_MM_DD_HH_MM_SS
         r'(\d{4})(\d{2})(\d{2})[-_](\d{2})(\d{2})(\d{2})',                  # YYYYMMDD-HHMMSS or YYYYMMDD_HHMMSS
@@ -73,7 +75,14 @@ class ExifAnalyzer:
         # Screenshot patterns with timestamps
         r'Screenshot_(\d{4})-(\d{2})-(\d{2})-(\d{2})-(\d{2})-(\d{2})',      # Screenshot_YYYY-MM-DD-HH-MM-SS
         r'Screen Shot (\d{4})-(\d{2})-(\d{2}) at (\d{1,2})\.(\d{2})\.(\d{2})', # Screen Shot YYYY-MM-DD at H.MM.SS
-    ]
+    )]
+    
+    # Every date pattern contains a four digit year, so filenames without one are skipped
+    # with a single scan instead of trying each pattern in turn
+    YEAR_DIGITS_PATTERN = re.compile(r'\d{4}')
+    
+    # Upper bound on the number of files analyzed concurrently
+    MAX_WORKERS = 8
     
     def __init__(self):
         self.media_files: List[MediaFile] = []
@@ -89,6 +98,23 @@ class ExifAnalyzer:
     def analyze_folder(self, folder_path: Union[str, Path], ignore_videos: bool = False, include_subfolders: bool = True) -> List[MediaFile]:
         """Analyze all media files in a folder for missing EXIF date information.
         
+        Args:
+            folder_path: Path to the folder to analyze
+            ignore_videos: If True, skip video files during analysis
+            include_subfolders: If True, search recursively in subfolders
+        """
+        for _ in self.iter_analyze_folder(folder_path, ignore_videos, include_subfolders):
+            pass
+        
+        return self.media_files
+    
+    def iter_analyze_folder(self, folder_path: Union[str, Path], ignore_videos: bool = False, include_subfolders: bool = True) -> Iterator[MediaFile]:
+        """Analyze all media files in a folder, yielding each file as soon as it is analyzed.
+        
+        Files are yielded in the order analyze_folder returns them, and media_files
+        and stats are updated as they go, so callers can show results while the
+        rest of the folder is still being analyzed.
+        
         Args:
             folder_path: Path to the folder to analyze
             ignore_videos: If True, skip video files during analysis
@@ -115,10 +141,15 @@ class ExifAnalyzer:
         
         self.stats['total_files'] = len(media_files)
         
-        # Analyze each file
-        for file_path in media_files:
-            try:
-                media_file = self._analyze_file(file_path)
+        # Analyze files concurrently, as reading the EXIF data is mostly waiting on I/O;
+        # results come back in file order and are counted in this thread, so the
+        # statistics need no extra synchronisation
+        max_workers = min(self.MAX_WORKERS, os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for media_file in executor.map(self._try_analyze_file, media_files):
+                if media_file is None:
+                    continue
+                
                 self.media_files.append(media_file)
                 
                 # Update statistics
@@ -135,12 +166,16 @@ class ExifAnalyzer:
                 
                 if media_file.suggested_date:
                     self.stats['files_with_suggestions'] += 1
-                    
-            except Exception as e:
-                print(f"Error analyzing {file_path}: {e}")
-                continue
-        
-        return self.media_files
+                
+                yield media_file
+    
+    def _try_analyze_file(self, file_path: Path) -> Optional[MediaFile]:
+        """Analyze a single media file, reporting errors instead of raising them."""
+        try:
+            return self._analyze_file(file_path)
+        except Exception as e:
+            print(f"Error analyzing {file_path}: {e}")
+            return None
     
     def _analyze_file(self, file_path: Path) -> MediaFile:
         """Analyze a single media file for date information."""
@@ -221,9 +256,11 @@ class ExifAnalyzer:
     def _extract_filename_date(self, media_file: MediaFile):
         """Extract date information from filename."""
         filename = media_file.name
+        if not self.YEAR_DIGITS_PATTERN.search(filename):
+            return
         
         for pattern in self.DATE_PATTERNS:
-            match = re.search(pattern, filename)
+            match = pattern.search(filename)
             if match:
                 try:
                     groups = match.groups()
@@ -342,6 +379,15 @@ class ExifAnalyzer:
         """Parse EXIF datetime string."""
         try:
             # EXIF datetime format: 'YYYY:MM:DD HH:MM:SS'
+            # Fast path: the canonical fixed-width form is sliced directly, avoiding strptime
+            if (isinstance(date_str, str) and len(date_str) == 19 and date_str.isascii()
+                    and date_str[4] == ':' and date_str[7] == ':' and date_str[10] == ' '
+                    and date_str[13] == ':' and date_str[16] == ':'):
+                parts = (date_str[0:4], date_str[5:7], date_str[8:10],
+                         date_str[11:13], date_str[14:16], date_str[17:19])
+                # int() also accepts signs, spaces and underscores, which strptime rejects
+                if all(part.isdigit() for part in parts):
+                    return datetime(*map(int, parts))
             return datetime.strptime(date_str, '%Y:%m:%d %H:%M:%S')
         except (ValueError, TypeError):
             return None
@@ -2,9 +2,14 @@
 EXIF Date Updater - Module for updating EXIF date information in media files.
 """
 
+import os
 import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import List
+from typing import Callable, Dict, List, Literal, Optional, Tuple
 
 import piexif
 
@@ -14,10 +19,51 @@ from .exif_analyzer import MediaFile
 class ExifUpdater:
     """Class for updating EXIF date information in media files."""
     
-    def __init__(self, create_backup: bool = True):
+    # Upper bound on the number of files updated concurrently by default
+    MAX_WORKERS = 8
+    
+    # How backups are created: a full copy, or a hard link sharing the original's data
+    BACKUP_MODES = ('copy', 'hardlink')
+    
+    def __init__(self, create_backup: bool = True, backup_mode: Literal['copy', 'hardlink'] = 'copy'):
+        if backup_mode not in self.BACKUP_MODES:
+            raise ValueError(f"Invalid backup mode: {backup_mode}")
+        
         self.create_backup = create_backup
+        self.backup_mode = backup_mode
         self.updated_files = []
         self.failed_updates = []
+        
+        # Guards updated_files and failed_updates, as files may be updated from several threads
+        self._results_lock = threading.Lock()
+        
+        # Next backup number to try for each file (0 is the plain .backup), so backing up
+        # the same file again doesn't probe all of its earlier backup names
+        self._backup_counters: Dict[Path, int] = {}
+        
+        # Messages and result of the file a worker thread of update_multiple_files is
+        # updating, held back so they are reported in the order of the input files
+        self._pending = threading.local()
+    
+    def _log(self, message: str):
+        """Print a message, or hold it back while update_multiple_files updates the file."""
+        messages = getattr(self._pending, 'messages', None)
+        if messages is None:
+            print(message)
+        else:
+            messages.append(message)
+    
+    def _record_result(self, file_path: Path, success: bool):
+        """Add a file to updated_files or failed_updates, or hold it back like _log."""
+        if getattr(self._pending, 'messages', None) is not None:
+            self._pending.result = (file_path, success)
+            return
+        
+        with self._results_lock:
+            if success:
+                self.updated_files.append(file_path)
+            else:
+                self.failed_updates.append(file_path)
     
     def update_file_dates(self, media_file: MediaFile, 
                          update_datetime_original: bool = True,
@@ -36,7 +82,7 @@ class ExifUpdater:
             bool: True if successful, False otherwise
         """
         if not media_file.suggested_date:
-            print(f"No suggested date for {media_file.name}")
+            self._log(f"No suggested date for {media_file.name}")
             return False
         
         # Check if there's anything to update
@@ -49,12 +95,12 @@ class ExifUpdater:
                                     abs(media_file.date_created.timestamp() - media_file.suggested_date.timestamp()) > 1.0))
         
         if not (needs_datetime_original_update or needs_date_created_update):
-            print(f"No updates needed for {media_file.name} - dates are already correct")
+            self._log(f"No updates needed for {media_file.name} - dates are already correct")
             return True  # Consider this successful since no changes are needed
         
         try:
             if dry_run:
-                print(f"[DRY RUN] Would update {media_file.name} with date {media_file.suggested_date}")
+                self._log(f"[DRY RUN] Would update {media_file.name} with date {media_file.suggested_date}")
                 return True
             
             # Create backup if requested
@@ -65,57 +111,123 @@ class ExifUpdater:
             if media_file.path.suffix.lower() in {'.jpg', '.jpeg', '.tiff', '.tif'}:
                 success = self._update_image_exif(media_file, update_datetime_original, update_date_created)
             else:
-                print(f"EXIF update not supported for {media_file.path.suffix} files")
+                self._log(f"EXIF update not supported for {media_file.path.suffix} files")
                 return False
             
             if success:
-                self.updated_files.append(media_file.path)
-                print(f"Successfully updated {media_file.name}")
+                self._record_result(media_file.path, True)
+                self._log(f"Successfully updated {media_file.name}")
             else:
-                self.failed_updates.append(media_file.path)
-                print(f"Failed to update {media_file.name}")
+                self._record_result(media_file.path, False)
+                self._log(f"Failed to update {media_file.name}")
             
             return success
             
         except Exception as e:
-            print(f"Error updating {media_file.name}: {e}")
-            self.failed_updates.append(media_file.path)
+            self._log(f"Error updating {media_file.name}: {e}")
+            self._record_result(media_file.path, False)
             return False
     
     def update_multiple_files(self, media_files: List[MediaFile],
                             update_datetime_original: bool = True,
                             update_date_created: bool = True,
-                            dry_run: bool = False) -> tuple[int, int]:
+                            dry_run: bool = False,
+                            max_workers: Optional[int] = None,
+                            progress_callback: Optional[Callable[[MediaFile, bool], None]] = None) -> tuple[int, int]:
         """
         Update EXIF dates for multiple media files.
         
+        Files are updated concurrently, as each update is independent and mostly
+        waiting on file I/O. Messages and results are still reported in input order.
+        
+        Args:
+            max_workers: Number of files updated at once (defaults to the CPU count,
+                capped at MAX_WORKERS); 1 updates the files one after another
+            progress_callback: Called with each file and whether its update succeeded,
+                in input order and on the calling thread
+        
         Returns:
             tuple: (successful_updates, failed_updates)
         """
         successful = 0
         failed = 0
         
-        for media_file in media_files:
-            if self.update_file_dates(media_file, update_datetime_original, 
-                                    update_date_created, dry_run):
-                successful += 1
-            else:
-                failed += 1
+        if max_workers is None:
+            max_workers = min(self.MAX_WORKERS, os.cpu_count() or 4)
+        
+        def update(media_file: MediaFile) -> Tuple[bool, List[str], Optional[Tuple[Path, bool]]]:
+            self._pending.messages = []
+            self._pending.result = None
+            try:
+                success = self.update_file_dates(media_file, update_datetime_original,
+                                                 update_date_created, dry_run)
+                return success, self._pending.messages, self._pending.result
+            finally:
+                del self._pending.messages
+        
+        # map yields the results in input order, so the messages of each file are printed
+        # together and updated_files/failed_updates don't depend on completion timing
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for media_file, (success, messages, result) in zip(media_files, executor.map(update, media_files)):
+                for message in messages:
+                    print(message)
+                if result is not None:
+                    self._record_result(*result)
+                if progress_callback:
+                    progress_callback(media_file, success)
+                
+                if success:
+                    successful += 1
+                else:
+                    failed += 1
         
         return successful, failed
     
     def _create_backup(self, file_path: Path):
         """Create a backup of the original file."""
-        backup_path = file_path.with_suffix(file_path.suffix + '.backup')
-        counter = 1
+        # Start over at the plain name once it is gone (restore_backup only looks there),
+        # e.g. after the backups were deleted outside of cleanup_backups
+        backup_path = self._backup_path(file_path, 0)
+        counter = self._backup_counters.get(file_path, 0) if backup_path.exists() else 0
+        backup_path = self._backup_path(file_path, counter)
         
-        # Handle multiple backups
+        # Handle multiple backups (still checked, as backups may also be created elsewhere)
         while backup_path.exists():
-            backup_path = file_path.with_suffix(f'{file_path.suffix}.backup.{counter}')
             counter += 1
+            backup_path = self._backup_path(file_path, counter)
+        self._backup_counters[file_path] = counter + 1
+        
+        if self.backup_mode == 'hardlink':
+            try:
+                # Only adds a directory entry; updates then write the file anew (see _replace_file)
+                os.link(file_path, backup_path)
+                self._log(f"Created backup: {backup_path.name}")
+                return
+            except OSError:
+                # Filesystems without hard links (e.g. FAT on memory cards) get a copy instead
+                pass
         
         shutil.copy2(file_path, backup_path)
-        print(f"Created backup: {backup_path.name}")
+        self._log(f"Created backup: {backup_path.name}")
+    
+    @staticmethod
+    def _backup_path(file_path: Path, counter: int) -> Path:
+        """Get the name of a file's backup with the given number (0 for the first backup)."""
+        if counter == 0:
+            return file_path.with_suffix(file_path.suffix + '.backup')
+        return file_path.with_suffix(f'{file_path.suffix}.backup.{counter}')
+    
+    def _replace_file(self, file_path: Path, data: bytes):
+        """Write data to a new file that atomically replaces file_path, keeping its permissions."""
+        fd, temp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            shutil.copymode(file_path, temp_name)
+            os.replace(temp_name, file_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
     
     def _update_image_exif(self, media_file: MediaFile, 
                           update_datetime_original: bool,
@@ -129,14 +241,14 @@ class ExifUpdater:
         try:
             # Ensure we have a suggested date (double-check for safety)
             if not media_file.suggested_date:
-                print(f"No suggested date available for {media_file.name}")
+                self._log(f"No suggested date available for {media_file.name}")
                 return False
             
             # Format the date for EXIF (YYYY:MM:DD HH:MM:SS)
             try:
                 exif_date_str = media_file.suggested_date.strftime('%Y:%m:%d %H:%M:%S')
             except AttributeError:
-                print(f"Error formatting date for {media_file.name}: suggested_date is {media_file.suggested_date}")
+                self._log(f"Error formatting date for {media_file.name}: suggested_date is {media_file.suggested_date}")
                 return False
             
             # Load existing EXIF data or create new
@@ -158,31 +270,41 @@ class ExifUpdater:
             # Update DateTimeOriginal if needed
             if needs_datetime_original_update:
                 exif_dict["Exif"][piexif.ExifIFD.DateTimeOriginal] = exif_date_str
-                print(f"  - Setting DateTimeOriginal: {exif_date_str}")
+                self._log(f"  - Setting DateTimeOriginal: {exif_date_str}")
             
             # Update DateCreated if needed
             if needs_date_created_update:
                 exif_dict["0th"][piexif.ImageIFD.DateTime] = exif_date_str
                 exif_dict["Exif"][piexif.ExifIFD.DateTimeDigitized] = exif_date_str
-                print(f"  - Setting DateTimeDigitized: {exif_date_str}")
+                self._log(f"  - Setting DateTimeDigitized: {exif_date_str}")
             
             # Only write EXIF data if we made changes
             if not (needs_datetime_original_update or needs_date_created_update):
-                print(f"  - No EXIF changes needed for {media_file.name}")
+                self._log(f"  - No EXIF changes needed for {media_file.name}")
                 return True
             
             # Convert back to bytes and save
             exif_bytes = piexif.dump(exif_dict)
             
+            # A hard-linked backup shares the file's data, so the updated image has to be
+            # written to a new file instead of in place
+            write_new_file = self.create_backup and self.backup_mode == 'hardlink'
+            
             try:
                 # Use piexif.insert to preserve original image data and only update EXIF
                 # This avoids recompression and maintains original file size
-                piexif.insert(exif_bytes, str(media_file.path))
+                if write_new_file:
+                    output = BytesIO()
+                    piexif.insert(exif_bytes, media_file.path.read_bytes(), output)
+                    self._replace_file(media_file.path, output.getvalue())
+                else:
+                    piexif.insert(exif_bytes, str(media_file.path))
             except Exception as insert_error:
                 # Fallback: If piexif.insert fails, use PIL but try to preserve quality
-                print(f"Warning: piexif.insert failed for {media_file.name}, using fallback method: {insert_error}")
+                self._log(f"Warning: piexif.insert failed for {media_file.name}, using fallback method: {insert_error}")
                 from PIL import Image
                 
+                output = BytesIO() if write_new_file else media_file.path
                 with Image.open(media_file.path) as img:
                     # Convert to RGB if necessary (for JPEG compatibility)
                     if img.mode in ('RGBA', 'LA', 'P'):
@@ -190,14 +312,17 @@ class ExifUpdater:
                     
                     # For JPEG files, use conservative quality settings
                     if media_file.path.suffix.lower() in {'.jpg', '.jpeg'}:
-                        img.save(media_file.path, exif=exif_bytes, quality=90, optimize=False)
+                        img.save(output, format='JPEG', exif=exif_bytes, quality=90, optimize=False)
                     else:
-                        img.save(media_file.path, exif=exif_bytes)
+                        img.save(output, format='TIFF', exif=exif_bytes)
+                
+                if write_new_file:
+                    self._replace_file(media_file.path, output.getvalue())
             
             return True
             
         except Exception as e:
-            print(f"Error updating EXIF for {media_file.name}: {e}")
+            self._log(f"Error updating EXIF for {media_file.name}: {e}")
             return False
     
     def restore_backup(self, file_path: Path) -> bool:
@@ -240,18 +365,35 @@ class ExifUpdater:
         
         return restored_count
     
+    @staticmethod
+    def _is_backup_name(name: str) -> bool:
+        """Check if a file name is one of the backup names created by _create_backup."""
+        if name.endswith('.backup'):
+            return True
+        _, separator, counter = name.rpartition('.backup.')
+        return bool(separator) and counter.isdigit()
+    
     def cleanup_backups(self, folder_path: Path) -> int:
         """Remove all backup files in a folder."""
         removed_count = 0
-        backup_files = list(folder_path.glob('*.backup*'))
         
-        for backup_file in backup_files:
-            try:
-                backup_file.unlink()
-                print(f"Removed backup: {backup_file.name}")
-                removed_count += 1
-            except Exception as e:
-                print(f"Error removing backup {backup_file.name}: {e}")
+        # Backup numbers start over once the old backups in this folder are gone
+        for file_path in [path for path in self._backup_counters if path.parent == folder_path]:
+            del self._backup_counters[file_path]
+        
+        # Directory entries carry their names, so no Path object or stat is needed per file
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if not self._is_backup_name(name):
+                    continue
+                
+                try:
+                    os.unlink(entry.path)
+                    print(f"Removed backup: {name}")
+                    removed_count += 1
+                except Exception as e:
+                    print(f"Error removing backup {name}: {e}")
         
         return removed_count
     
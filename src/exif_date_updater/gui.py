@@ -2,44 +2,114 @@
 GUI interface for the EXIF Date Updater using PySide6.
 """
 
+import logging
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
-from PySide6.QtCore import QThread, Signal, Qt, QDateTime
-from PySide6.QtGui import QFont, QTextCursor, QColor, QKeySequence, QShortcut, QPalette, QIcon
+from PySide6.QtCore import QThread, Signal, Qt, QDateTime, QObject, QRunnable, QThreadPool, QEvent, QTimer
+from PySide6.QtGui import QFont, QTextCursor, QColor, QKeySequence, QShortcut, QPalette, QIcon, QPixmap
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QFileDialog, QTableWidget, QTableWidgetItem,
-    QTextEdit, QProgressBar, QCheckBox, QGroupBox, QMessageBox,
-    QSplitter, QHeaderView, QStatusBar, QComboBox, QDateTimeEdit, QDialog
+    QLabel, QPushButton, QFileDialog, QTableView, QAbstractItemView,
+    QPlainTextEdit, QProgressBar, QCheckBox, QGroupBox, QMessageBox,
+    QSplitter, QHeaderView, QStatusBar, QComboBox, QDateTimeEdit, QDialog,
+    QStyledItemDelegate, QAbstractItemDelegate
 )
 
 from .exif_analyzer import ExifAnalyzer, MediaFile
 from .exif_updater import ExifUpdater
+from .table_model import MediaFileTableModel, SourcesRole, TableRowRole
 from .table_row import TableRow
 
-class NumericTableWidgetItem(QTableWidgetItem):
-    """QTableWidgetItem that sorts numerically while displaying formatted text."""
-    
-    def __init__(self, text: str, numeric_value: float):
-        super().__init__(text)
-        self.numeric_value = numeric_value
-    
-    def __lt__(self, other):
-        """Compare numerically for sorting."""
-        if isinstance(other, NumericTableWidgetItem):
-            return self.numeric_value < other.numeric_value
-        return super().__lt__(other)
+logger = logging.getLogger(__name__)
 
+_ICONS_DIR = Path(__file__).parent / "resources" / "icons"
 
-class NoScrollComboBox(QComboBox):
-    """QComboBox that ignores wheel events to prevent interfering with table scrolling."""
+# Text colors for dates that will be written, for light and dark themes
+_HIGHLIGHT_COLOR_LIGHT = QColor(220, 20, 20)
+_HIGHLIGHT_COLOR_DARK = QColor(255, 100, 100)
+
+
+@lru_cache(maxsize=1)
+def _app_icon() -> QIcon:
+    """Build the application icon once per process from the bundled logo files."""
+    # Create QIcon with multiple resolutions for crisp display at different sizes
+    icon = QIcon()
+    for name in ("logo_128.png", "logo_256.png"):
+        icon_path = _ICONS_DIR / name
+        if icon_path.exists():
+            # Decode each PNG once up front instead of letting QIcon reload it per size request
+            pixmap = QPixmap(str(icon_path))
+            if not pixmap.isNull():
+                icon.addPixmap(pixmap)
+    return icon
+
+
+class SourceComboDelegate(QStyledItemDelegate):
+    """Item delegate that creates the source dropdown only while a source cell is being edited."""
     
-    def wheelEvent(self, event):
-        """Ignore wheel events to allow table scrolling."""
-        event.ignore()
+    source_changed = Signal(object, object)  # TableRow, (date, source name) of the selected item
+    
+    def createEditor(self, parent, option, index):
+        """Create an empty source dropdown for a row, filled in setEditorData."""
+        table_row = index.data(TableRowRole)
+        if table_row is None:
+            return super().createEditor(parent, option, index)
+        
+        combo = QComboBox(parent)
+        combo.setToolTip(index.data(Qt.ItemDataRole.ToolTipRole))
+        
+        # Tag the combo with its TableRow, so one shared slot can serve every dropdown
+        combo.setProperty("table_row", table_row)
+        return combo
+    
+    def setEditorData(self, editor, index):
+        """Fill the dropdown with the row's sources and select its current source."""
+        # Also called when the row changes while the dropdown is open; keep the dropdown's
+        # own selection then, as selections are applied as soon as they are made
+        if editor.count():
+            return
+        
+        options, current_index = index.data(SourcesRole)
+        for display_text, item_data in options:
+            editor.addItem(display_text, item_data)
+        editor.setCurrentIndex(current_index)
+        
+        # Connect only after filling, so populating doesn't count as a selection
+        editor.currentIndexChanged.connect(self._on_combo_index_changed)
+    
+    def setModelData(self, editor, model, index):
+        """Nothing to commit, selections were already applied through source_changed."""
+        pass
+    
+    def eventFilter(self, obj, event):
+        """Pass wheel events over the dropdown on to the table, to keep scrolling uninterrupted."""
+        # The view installs its delegate as the event filter of every editor it opens,
+        # so this covers the dropdown without subclassing QComboBox
+        if event.type() == QEvent.Type.Wheel and isinstance(obj, QComboBox) and obj.parentWidget():
+            QApplication.sendEvent(obj.parentWidget(), event)
+            return True
+        return super().eventFilter(obj, event)
+    
+    def _on_combo_index_changed(self, combo_index: int):
+        """Forward a dropdown selection together with the TableRow the dropdown belongs to."""
+        combo = self.sender()
+        table_row = combo.property("table_row") if combo else None
+        if table_row is None or combo_index < 0:
+            return
+        
+        item_data = combo.itemData(combo_index)
+        
+        # The manual date dialog takes the focus, which closes and deletes the dropdown
+        # anyway; close it right away, the cell shows the row's source once it is done
+        if isinstance(item_data, tuple) and len(item_data) == 2 and item_data[1] == "Manual":
+            self.closeEditor.emit(combo, QAbstractItemDelegate.EndEditHint.NoHint)
+        
+        self.source_changed.emit(table_row, item_data)
 
 
 class ManualDateDialog(QDialog):
@@ -88,32 +158,26 @@ class ManualDateDialog(QDialog):
     def get_datetime(self) -> datetime:
         """Return the selected datetime as a Python datetime object."""
         qt_datetime = self.datetime_edit.dateTime()
-        # Use toPython() method which is more reliable than timestamp conversion
-        try:
-            result = qt_datetime.toPython()
-            # Ensure we got a datetime object
-            if isinstance(result, datetime):
-                return result
-            else:
-                # Fallback if toPython() didn't return a datetime
-                raise ValueError("toPython() did not return a datetime object")
-        except (OSError, ValueError, OverflowError, AttributeError):
-            # Fallback: manually construct datetime from components
-            date = qt_datetime.date()
-            time = qt_datetime.time()
-            return datetime(
-                date.year(), date.month(), date.day(),
-                time.hour(), time.minute(), time.second()
-            )
+        # Build the naive datetime directly from the components shown in the editor
+        date = qt_datetime.date()
+        time = qt_datetime.time()
+        return datetime(
+            date.year(), date.month(), date.day(),
+            time.hour(), time.minute(), time.second()
+        )
 
 
 class AnalysisWorker(QThread):
     """Worker thread for analyzing media files."""
     
     progress = Signal(str)  # Progress message
+    files_analyzed = Signal(list)  # Batch of MediaFile objects analyzed since the last batch
     finished = Signal(list)  # List of MediaFile objects
     error = Signal(str)  # Error message
     
+    # Minimum number of seconds between two batches of analyzed files
+    BATCH_INTERVAL = 0.1
+    
     def __init__(self, folder_path: Path, ignore_videos: bool = False, include_subfolders: bool = True):
         super().__init__()
         self.folder_path = folder_path
@@ -124,11 +188,27 @@ class AnalysisWorker(QThread):
     def run(self):
         try:
             self.progress.emit("Starting analysis...")
-            media_files = self.analyzer.analyze_folder(
+            
+            # Hand analyzed files to the GUI in batches, so the table fills up while the
+            # rest of the folder is analyzed without a signal per file
+            batch = []
+            last_emit = time.monotonic()
+            for media_file in self.analyzer.iter_analyze_folder(
                 self.folder_path, 
                 ignore_videos=self.ignore_videos,
                 include_subfolders=self.include_subfolders
-            )
+            ):
+                batch.append(media_file)
+                now = time.monotonic()
+                if now - last_emit >= self.BATCH_INTERVAL:
+                    self.files_analyzed.emit(batch)
+                    batch = []
+                    last_emit = now
+            
+            if batch:
+                self.files_analyzed.emit(batch)
+            
+            media_files = self.analyzer.media_files
             self.progress.emit(f"Analysis complete! Found {len(media_files)} files.")
             self.finished.emit(media_files)
         except Exception as e:
@@ -142,6 +222,9 @@ class UpdateWorker(QThread):
     finished = Signal(int, int)  # (successful, failed) counts
     error = Signal(str)  # Error message
     
+    # Minimum number of seconds between two progress emissions
+    PROGRESS_INTERVAL = 0.05
+    
     def __init__(self, media_files: List[MediaFile], 
                  update_datetime_original: bool,
                  update_date_created: bool,
@@ -161,35 +244,62 @@ class UpdateWorker(QThread):
             else:
                 self.progress.emit("Updating EXIF data...")
             
-            successful = 0
-            failed = 0
+            action = "Simulated" if self.dry_run else "Updated"
+            
+            # Per-file messages are buffered and emitted in batches to avoid
+            # flooding the GUI thread with one log append per file
+            pending_messages = []
+            last_emit = 0.0
             
-            # Process each file individually to provide per-file logging
-            for i, file in enumerate(self.media_files, 1):
-                try:
-                    # Update individual file (handles both dry_run and actual updates)
-                    result = self.updater.update_file_dates(
-                        file,
-                        self.update_datetime_original,
-                        self.update_date_created,
-                        dry_run=self.dry_run
-                    )
-                    
-                    if result:
-                        action = "Simulated" if self.dry_run else "Updated"
-                        self.progress.emit(f"{action}: {file.name}")
-                        successful += 1
-                    else:
-                        failed += 1
-                            
-                except Exception:
-                    failed += 1
+            def on_file_updated(file: MediaFile, success: bool):
+                nonlocal last_emit
+                if success:
+                    pending_messages.append(f"{action}: {file.name}")
+                
+                now = time.monotonic()
+                if pending_messages and now - last_emit >= self.PROGRESS_INTERVAL:
+                    self.progress.emit("\n".join(pending_messages))
+                    pending_messages.clear()
+                    last_emit = now
+            
+            # The updater updates the files concurrently and reports them in input order,
+            # on this thread, like the CLI's updates
+            successful, failed = self.updater.update_multiple_files(
+                self.media_files,
+                self.update_datetime_original,
+                self.update_date_created,
+                dry_run=self.dry_run,
+                progress_callback=on_file_updated
+            )
+            
+            # Flush whatever is left before reporting completion
+            if pending_messages:
+                self.progress.emit("\n".join(pending_messages))
             
             self.finished.emit(successful, failed)
         except Exception as e:
             self.error.emit(str(e))
 
 
+class FolderScanSignals(QObject):
+    """Signals for FolderScanTask (QRunnable itself cannot emit signals)."""
+    
+    finished = Signal(object)  # Path of the first dropped folder, or None
+
+
+class FolderScanTask(QRunnable):
+    """Thread pool task resolving which dropped path is a folder, off the GUI thread."""
+    
+    def __init__(self, paths: List[Path]):
+        super().__init__()
+        self.paths = paths
+        self.signals = FolderScanSignals()
+    
+    def run(self):
+        folder = next((path for path in self.paths if path.is_dir()), None)
+        self.signals.finished.emit(folder)
+
+
 class ExifDateUpdaterGUI(QMainWindow):
     """Main GUI application for EXIF Date Updater."""
     
@@ -209,12 +319,29 @@ class ExifDateUpdaterGUI(QMainWindow):
         self.media_files: List[MediaFile] = []
         self.analyzer = ExifAnalyzer()
         
-        # Table rows containing all UI state
-        self.table_rows: List[TableRow] = []
+        # Table rows containing all UI state, keyed by id() of their MediaFile; rows are
+        # only created once their file passes the filters. "Show all files" is on by
+        # default, so every file gets its row on the first populate; only with it turned
+        # off are files without missing dates left without one until they are shown
+        self._table_rows: Dict[int, TableRow] = {}
+        
+        # Rows passing the current filters, cached until the filters or rows change
+        self._filtered_cache: Optional[List[TableRow]] = None
+        
+        # Palette-derived table colors, computed on first use and reset on palette changes
+        self._cached_colors: Optional[Tuple[QColor, QColor, QColor]] = None
+        self._is_dark: Optional[bool] = None
         
         # Workers
         self.analysis_worker: Optional[AnalysisWorker] = None
         self.update_worker: Optional[UpdateWorker] = None
+        self.folder_scan_task: Optional[FolderScanTask] = None
+        
+        # Coalesces status bar refreshes when many rows change in quick succession
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self.update_status_bar)
         
         # Setup UI
         self.setup_ui()
@@ -226,29 +353,12 @@ class ExifDateUpdaterGUI(QMainWindow):
         self.status_bar.showMessage("Ready - Drop a folder here or use the Select Folder button")
     
     def setup_window_icon(self):
-        """Setup the window icon using the logo files."""
+        """Setup the window icon using the cached application icon."""
         try:
-            # Get the path to the icons directory
-            icons_dir = Path(__file__).parent / "resources" / "icons"
-            
-            # Create QIcon with multiple resolutions for crisp display at different sizes
-            icon = QIcon()
-            
-            # Add the 128x128 version
-            icon_128_path = icons_dir / "logo_128.png"
-            if icon_128_path.exists():
-                icon.addFile(str(icon_128_path))
-            
-            # Add the 256x256 version for higher DPI displays
-            icon_256_path = icons_dir / "logo_256.png"
-            if icon_256_path.exists():
-                icon.addFile(str(icon_256_path))
-            
-            # Set the window icon
+            icon = _app_icon()
+            # Nothing to do if neither logo file is available
             if not icon.isNull():
                 self.setWindowIcon(icon)
-            else:
-                print("Warning: Could not load application icon")
                 
         except Exception as e:
             print(f"Error loading window icon: {e}")
@@ -326,45 +436,30 @@ class ExifDateUpdaterGUI(QMainWindow):
         
         table_layout.addLayout(table_options_layout)
         
-        self.file_table = QTableWidget()
-        self.file_table.setColumnCount(7)
-        self.file_table.setHorizontalHeaderLabels([
-            "Update", "Filename", "Type", "DateTimeOriginal", "DateCreated", "Source", "Size"
-        ])
+        # The model produces cells on demand from the TableRows instead of one item per cell
+        self.file_model = MediaFileTableModel(self)
+        self.file_table = QTableView()
+        self.file_table.setModel(self.file_model)
+        
+        # The source dropdown is only created while a source cell is being edited
+        self.source_delegate = SourceComboDelegate(self.file_table)
+        self.source_delegate.source_changed.connect(self.on_source_changed_by_table_row)
+        self.file_table.setItemDelegate(self.source_delegate)
+        self.file_table.setEditTriggers(
+            QAbstractItemView.EditTrigger.CurrentChanged | QAbstractItemView.EditTrigger.SelectedClicked
+        )
         
         # Enable multiselect functionality
-        self.file_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.file_table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
-        
-        # Enable column sorting
-        self.file_table.setSortingEnabled(True)
+        self.file_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.file_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         
         # Connect selection change to update row appearance
         self.file_table.selectionModel().selectionChanged.connect(self._on_table_selection_changed)
         
-        # Add tooltips to column headers
+        # Column header tooltips are provided by the model
         header = self.file_table.horizontalHeader()
         header.setToolTip("EXIF date values - missing values highlighted in red, use dropdowns to select date sources")
         
-        # Set tooltips for each column header
-        for col in range(self.file_table.columnCount()):
-            item = self.file_table.horizontalHeaderItem(col)
-            if item:
-                if col == 0:
-                    item.setToolTip("Check to include this file in the update process")
-                elif col == 1:
-                    item.setToolTip("Filename")
-                elif col == 2:
-                    item.setToolTip("File type/extension")
-                elif col == 3:
-                    item.setToolTip("Current DateTimeOriginal EXIF value (empty if missing)")
-                elif col == 4:
-                    item.setToolTip("Current DateCreated EXIF value (empty if missing)")
-                elif col == 5:
-                    item.setToolTip("Select date source from available options")
-                elif col == 6:
-                    item.setToolTip("File size in bytes")
-        
         # Make table responsive
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # Update checkbox
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)  # Filename
@@ -377,6 +472,11 @@ class ExifDateUpdaterGUI(QMainWindow):
         # Set minimum width for source column to accommodate dropdown
         header.resizeSection(5, 250)
         
+        # Header clicks sort the model's TableRow list with native keys; start without
+        # a sort indicator so files keep their analysis order until a column is clicked
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.file_table.setSortingEnabled(True)
+        
         table_layout.addWidget(self.file_table)
         splitter.addWidget(self.table_group)
         
@@ -417,8 +517,12 @@ class ExifDateUpdaterGUI(QMainWindow):
         log_group = QGroupBox("Activity Log")
         log_layout = QVBoxLayout(log_group)
         
-        self.log_text = QTextEdit()
+        # QPlainTextEdit is optimized for high-volume appends; keep the log bounded
+        # so large update runs don't grow it without limit
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setMaximumBlockCount(5000)
         self.log_text.setMaximumHeight(200)
         font = QFont("Consolas", 9)
         self.log_text.setFont(font)
@@ -442,9 +546,9 @@ class ExifDateUpdaterGUI(QMainWindow):
         self.ignore_video_files_cb.stateChanged.connect(self.on_ignore_video_files_changed)
         self.include_subfolders_cb.stateChanged.connect(self.on_include_subfolders_changed)
         
-        # Connect update checkboxes to repopulate table when output options change
-        self.update_datetime_original_cb.toggled.connect(self.populate_file_table)
-        self.update_date_created_cb.toggled.connect(self.populate_file_table)
+        # Connect update checkboxes to refresh the date columns when output options change
+        self.update_datetime_original_cb.toggled.connect(self._refresh_all_date_columns)
+        self.update_date_created_cb.toggled.connect(self._refresh_all_date_columns)
         
         # Selection buttons
         self.select_all_btn.clicked.connect(self.select_all_files)
@@ -493,45 +597,68 @@ class ExifDateUpdaterGUI(QMainWindow):
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
+        # Clear the previous results; the table is filled as files are analyzed
+        self.media_files = []
+        self.clear_table_rows()
+        self.populate_file_table()
+        
         # Start worker thread
         ignore_videos = self.ignore_video_files_cb.isChecked()
         include_subfolders = self.include_subfolders_cb.isChecked()
         self.analysis_worker = AnalysisWorker(self.folder_path, ignore_videos, include_subfolders)
         self.analysis_worker.progress.connect(self.log)
+        self.analysis_worker.files_analyzed.connect(self.on_files_analyzed)
         self.analysis_worker.finished.connect(self.on_analysis_finished)
         self.analysis_worker.error.connect(self.on_analysis_error)
         self.analysis_worker.start()
     
+    def on_files_analyzed(self, media_files: List[MediaFile]):
+        """Append a batch of analyzed files to the table while the analysis is still running."""
+        self.media_files.extend(media_files)
+        
+        # Keep the filter cache in step instead of refiltering all rows for every batch
+        is_shown = self._file_filter()
+        shown_rows = [self._table_row_for(file) for file in media_files if is_shown(file)]
+        if self._filtered_cache is not None:
+            self._filtered_cache.extend(shown_rows)
+        
+        self.file_model.append_rows(shown_rows)
+        self._status_timer.start()
+    
     def on_analysis_finished(self, media_files: List[MediaFile]):
         """Handle analysis completion."""
-        self.media_files = media_files
-        
-        # Create table rows for all files and tie them directly to the files
-        self.create_table_rows()
+        # All files were already added to the table batch by batch; only their order
+        # is left to settle, as each batch was appended at the end
+        if self.file_model.sort_column >= 0:
+            self.file_model.sort(self.file_model.sort_column, self.file_model.sort_order)
         
-        self.populate_file_table()
         self.set_ui_enabled(True)
         self.progress_bar.setVisible(False)
         
         # Show summary
-        missing_files = [row for row in self.table_rows if row.has_missing_dates]
-        self.log(f"Analysis complete! Found {len(missing_files)} files with missing dates.")
+        missing_count = sum(1 for file in self.media_files if file.missing_dates)
+        self.log(f"Analysis complete! Found {missing_count} files with missing dates.")
         
-        if missing_files:
+        if missing_count:
             self.dry_run_btn.setEnabled(True)
             self.update_btn.setEnabled(True)
         
         self.update_status_bar()
     
-    def create_table_rows(self):
-        """Create TableRow objects for each MediaFile."""
-        self.table_rows.clear()
-        
-        for media_file in self.media_files:
+    def clear_table_rows(self):
+        """Drop the TableRow objects of previously analyzed files."""
+        self._table_rows = {}
+        self._filtered_cache = None
+    
+    def _table_row_for(self, media_file: MediaFile) -> TableRow:
+        """Get the TableRow of a MediaFile, creating it the first time the file is shown."""
+        row = self._table_rows.get(id(media_file))
+        if row is None:
             row = TableRow(media_file=media_file)
             # Set up the update callback so the row can notify us of changes
             row.set_update_callback(self._on_table_row_updated)
-            self.table_rows.append(row)
+            self._table_rows[id(media_file)] = row
+        return row
     
     def on_analysis_error(self, error_msg: str):
         """Handle analysis error."""
@@ -543,12 +670,14 @@ class ExifDateUpdaterGUI(QMainWindow):
     
     def on_show_all_files_changed(self):
         """Handle change in show all files checkbox."""
+        self._filtered_cache = None
         if self.media_files:
             self.populate_file_table()
             self.update_status_bar()
     
     def on_ignore_video_files_changed(self):
         """Handle change in ignore video files checkbox."""
+        self._filtered_cache = None
         if self.media_files:
             self.populate_file_table()
             self.update_status_bar()
@@ -561,389 +690,195 @@ class ExifDateUpdaterGUI(QMainWindow):
     
     def get_filtered_rows(self) -> List[TableRow]:
         """Get the current filtered list of table rows based on UI settings."""
-        if self.show_all_files_cb.isChecked():
-            rows_to_show = self.table_rows
-        else:
-            rows_to_show = [row for row in self.table_rows if row.has_missing_dates]
+        if self._filtered_cache is not None:
+            return self._filtered_cache
         
-        # Filter out video files if the ignore option is checked
-        if self.ignore_video_files_cb.isChecked():
-            rows_to_show = [row for row in rows_to_show if not row.is_video_file]
+        is_shown = self._file_filter()
+        rows_to_show = [self._table_row_for(file) for file in self.media_files if is_shown(file)]
         
+        self._filtered_cache = rows_to_show
         return rows_to_show
     
-    def on_source_changed(self, row: int, combo_index: int):
-        """Handle source selection change in dropdown."""
-        print(f"DEBUG: on_source_changed called with row={row}, combo_index={combo_index}")
+    def _file_filter(self) -> Callable[[MediaFile], bool]:
+        """Get a predicate telling whether a file passes the current filters."""
+        show_all_files = self.show_all_files_cb.isChecked()
         
-        combo = self.file_table.cellWidget(row, 5)  # Source column is now index 5
-        print(f"DEBUG: Got combo from visual row {row}: {combo is not None}")
+        # Filter out video files if the ignore option is checked
+        ignore_videos = self.ignore_video_files_cb.isChecked()
+        video_extensions = ExifAnalyzer.VIDEO_EXTENSIONS
         
-        if isinstance(combo, (QComboBox, NoScrollComboBox)) and combo_index >= 0:
-            # Get the selected source data
-            item_data = combo.itemData(combo_index)
-            
-            # Handle case where itemData returns None
-            if item_data is None:
-                print(f"Warning: No data found for combo index {combo_index} in row {row}")
-                return
-            
-            # Ensure we can unpack the data
-            try:
-                date, source_name = item_data
-            except (TypeError, ValueError):
-                print(f"Warning: Invalid data format for combo index {combo_index} in row {row}: {item_data}")
-                return
-            
-            # Get the TableRow object for this visual row
-            table_row = self.get_table_row_for_visual_row(row)
-            if not table_row:
-                print(f"Warning: Could not find TableRow for visual row {row}")
-                return
-            
-            # Check if manual option was selected (either "Manual..." or "Manual (date)")
-            if source_name == "Manual":
-                # Open manual date dialog
-                current_file = table_row.media_file
-                
-                # Use existing suggested date as initial value, if available
-                initial_date = None
-                if hasattr(current_file, 'suggested_date') and current_file.suggested_date:
-                    initial_date = current_file.suggested_date
-                elif isinstance(date, datetime):
-                    # If we already have a manual date stored in the combo, use that
-                    initial_date = date
-                
-                dialog = ManualDateDialog(self, initial_date)
-                if dialog.exec() == QDialog.DialogCode.Accepted:
-                    # User confirmed the manual date
-                    manual_date = dialog.get_datetime()
-                    
-                    # Update the MediaFile object
-                    current_file.suggested_date = manual_date
-                    current_file.source = "Manual"
-                    
-                    # Update the combo box to show the manual date
-                    date_str = manual_date.strftime("%Y-%m-%d %H:%M:%S")
-                    manual_display = f"Manual ({date_str})"
-                    combo.setItemText(combo_index, manual_display)
-                    combo.setItemData(combo_index, (manual_date, "Manual"))
-                    
-                    # Notify the TableRow that it has been updated
-                    # This will automatically handle the GUI updates through the callback
-                    table_row._notify_update()
-                    
-                else:
-                    # User cancelled - revert to previous selection
-                    if hasattr(current_file, 'source') and current_file.source != "Manual":
-                        # Find the previous source in the combo and select it
-                        for i in range(combo.count()):
-                            item_date, item_source = combo.itemData(i)
-                            if item_source == current_file.source:
-                                combo.setCurrentIndex(i)
-                                break
-                    else:
-                        # If no previous source, select the first item (if available)
-                        if combo.count() > 1:  # More than just the manual option
-                            combo.setCurrentIndex(0)
-                
-                return
-            
-            # Handle regular (non-manual) source selection - ensure date is a datetime object
-            if isinstance(date, datetime):
-                file = table_row.media_file
-                print(f"DEBUG: Updating {file.name} - Old suggested: {file.suggested_date}, New: {date}")
-                
-                file.suggested_date = date
-                file.source = source_name
-                print(f"DEBUG: Updated {file.name} - New suggested: {file.suggested_date}")
-                
-                # Notify the TableRow that it has been updated
-                # This will automatically handle the GUI updates through the callback
-                table_row._notify_update()
-
-    def on_source_changed_by_table_row(self, table_row: 'TableRow', combo_index: int):
+        return lambda file: ((show_all_files or bool(file.missing_dates))
+                             and not (ignore_videos and file.extension in video_extensions))
+    
+    def on_source_changed_by_table_row(self, table_row: 'TableRow', item_data: object):
         """Handle source selection change using TableRow object directly (sorting-safe)."""
-        print(f"DEBUG: on_source_changed_by_table_row called for {table_row.filename}, combo_index={combo_index}")
-        
-        combo = table_row.source_combo
-        if not isinstance(combo, (QComboBox, NoScrollComboBox)) or combo_index < 0:
-            return
-        
-        # Get the selected source data
-        item_data = combo.itemData(combo_index)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("on_source_changed_by_table_row called for %s, item_data=%s",
+                         table_row.filename, item_data)
         
         # Handle case where itemData returns None
         if item_data is None:
-            print(f"Warning: No data found for combo index {combo_index} for {table_row.filename}")
+            print(f"Warning: No data found for the selected source of {table_row.filename}")
             return
         
         # Ensure we can unpack the data
         try:
             date, source_name = item_data
         except (TypeError, ValueError):
-            print(f"Warning: Invalid data format for combo index {combo_index} for {table_row.filename}: {item_data}")
+            print(f"Warning: Invalid source data for {table_row.filename}: {item_data}")
             return
         
         # Check if manual option was selected (either "Manual..." or "Manual (date)")
         if source_name == "Manual":
-            # Open manual date dialog
-            current_file = table_row.media_file
-            
-            # Use existing suggested date as initial value, if available
-            initial_date = None
-            if hasattr(current_file, 'suggested_date') and current_file.suggested_date:
-                initial_date = current_file.suggested_date
-            elif isinstance(date, datetime):
-                # If we already have a manual date stored in the combo, use that
-                initial_date = date
-            
-            dialog = ManualDateDialog(self, initial_date)
-            if dialog.exec() == QDialog.DialogCode.Accepted:
-                # User confirmed the manual date
-                manual_date = dialog.get_datetime()
-                
-                # Update the MediaFile object
-                current_file.suggested_date = manual_date
-                current_file.source = "Manual"
-                
-                # Update the combo box to show the manual date
-                date_str = manual_date.strftime("%Y-%m-%d %H:%M:%S")
-                manual_display = f"Manual ({date_str})"
-                combo.setItemText(combo_index, manual_display)
-                combo.setItemData(combo_index, (manual_date, "Manual"))
-                
-                # Notify the TableRow that it has been updated
-                # This will automatically handle the GUI updates through the callback
-                table_row._notify_update()
-                
-            else:
-                # User cancelled - revert to previous selection
-                if hasattr(current_file, 'source') and current_file.source != "Manual":
-                    # Find the previous source in the combo and select it
-                    for i in range(combo.count()):
-                        item_date, item_source = combo.itemData(i)
-                        if item_source == current_file.source:
-                            combo.setCurrentIndex(i)
-                            break
-                else:
-                    # If no previous source, select the first item (if available)
-                    if combo.count() > 1:  # More than just the manual option
-                        combo.setCurrentIndex(0)
-            
+            # Open the dialog once the dropdown's signal handling is over, as the
+            # dropdown is closed and deleted meanwhile
+            QTimer.singleShot(0, lambda: self.enter_manual_date(table_row, date))
             return
         
         # Handle regular (non-manual) source selection - ensure date is a datetime object
         if isinstance(date, datetime):
             file = table_row.media_file
-            print(f"DEBUG: Updating {file.name} - Old suggested: {file.suggested_date}, New: {date}")
+            
+            # Nothing to redraw if the source that is already in use was re-selected
+            if file.suggested_date == date and file.source == source_name:
+                return
+            
+            logger.debug("Updating %s - Old suggested: %s, New: %s", file.name, file.suggested_date, date)
             
             file.suggested_date = date
             file.source = source_name
-            print(f"DEBUG: Updated {file.name} - New suggested: {file.suggested_date}")
+            table_row.refresh_suggested()
+            logger.debug("Updated %s - New suggested: %s", file.name, file.suggested_date)
             
             # Notify the TableRow that it has been updated
             # This will automatically handle the GUI updates through the callback
             table_row._notify_update()
 
-    def _on_checkbox_changed_simple(self):
-        """Simplified checkbox handler using TableRow."""
-        sender_checkbox = self.sender()
-        if not isinstance(sender_checkbox, QCheckBox):
-            return
+    def enter_manual_date(self, table_row: 'TableRow', manual_date: object = None):
+        """Ask for a manual date for a row and use it as the row's suggested date."""
+        current_file = table_row.media_file
         
-        # Get the TableRow from the checkbox property
-        table_row = sender_checkbox.property("table_row")
-        if not table_row:
-            return
+        # Start from a previously entered manual date, else from the current suggestion
+        initial_date = manual_date if isinstance(manual_date, datetime) else current_file.suggested_date
         
-        # Update the TableRow's selection state
-        # This will automatically trigger the _on_table_row_updated callback
-        table_row.is_selected = sender_checkbox.isChecked()
+        dialog = ManualDateDialog(self, initial_date)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            # The TableRow keeps the manual date for the dropdown and updates the MediaFile;
+            # its update callback then refreshes the row through the model
+            table_row.set_manual_date(dialog.get_datetime())
+        
+        # On cancel nothing was changed; the cell still shows the previous source
     
     def _on_table_row_updated(self, table_row: 'TableRow'):
         """Handle updates from TableRow objects - update the visual row without relying on indices."""
         # Find the current visual row for this table_row
         visual_row = self.find_visual_row_for_table_row(table_row)
         if visual_row is not None:
-            # Temporarily disable sorting to prevent row reordering during update
-            was_sorting_enabled = self.file_table.isSortingEnabled()
-            if was_sorting_enabled:
-                self.file_table.setSortingEnabled(False)
-            
-            # Update checkbox sort data
-            checkbox_item = self.file_table.item(visual_row, 0)
-            if checkbox_item:
-                sort_value = 1 if table_row.is_selected else 0
-                checkbox_item.setData(Qt.ItemDataRole.UserRole, sort_value)
-                checkbox_item.setText(str(sort_value))
-            
-            # Update date columns to reflect any changes
-            self.update_date_columns_for_row(visual_row)
-            
-            # Re-enable sorting if it was enabled
-            if was_sorting_enabled:
-                self.file_table.setSortingEnabled(True)
-                
-                # Find the new visual row after sorting (might have changed)
-                new_visual_row = self.find_visual_row_for_table_row(table_row)
-                if new_visual_row is not None:
-                    # Update row appearance at the new position
-                    self.update_row_appearance(new_visual_row)
-                else:
-                    # Fallback: update all row appearances
-                    self._update_all_row_appearances()
-            else:
-                # Update row appearance at current position
-                self.update_row_appearance(visual_row)
+            # Redraw the row so its checkbox, dates, source and colors reflect the change
+            # (rows are only reordered on an explicit sort)
+            self.update_row_appearance(visual_row)
             
-            # Update status bar
-            self.update_status_bar()
+            # Update status bar once the current burst of row updates is over
+            self._status_timer.start()
             
-            # Force repaint to ensure changes are visible
-            self.file_table.viewport().repaint()
+            # Schedule a repaint; update() coalesces when many rows are toggled at once
+            self.file_table.viewport().update()
     
     def _on_table_selection_changed(self):
         """Handle table row selection changes."""
-        # Update appearance of all rows based on selection
-        for row in range(self.file_table.rowCount()):
-            self.update_row_appearance(row)
-        self.file_table.viewport().repaint()
-    
-    def update_date_columns_for_row(self, visual_row: int):
-        """Update the DateTimeOriginal and DateCreated columns for a specific visual row."""
-        table_row = self.get_table_row_for_visual_row(visual_row)
-        if not table_row:
-            return
-        
-        
-        # Update DateTimeOriginal column (column 3)
-        datetime_original_item = self.file_table.item(visual_row, 3)
-        if datetime_original_item:
-            update_enabled = self.update_datetime_original_cb.isChecked()
-            display_text = table_row.get_datetime_original_for_update(update_enabled)
-            timestamp = table_row.get_datetime_original_timestamp_for_update(update_enabled)
-            
-            datetime_original_item.setText(display_text)
-            datetime_original_item.setData(Qt.ItemDataRole.UserRole, timestamp)
-        
-        # Update DateCreated column (column 4)
-        date_created_item = self.file_table.item(visual_row, 4)
-        if date_created_item:
-            update_enabled = self.update_date_created_cb.isChecked()
-            display_text = table_row.get_date_created_for_update(update_enabled)
-            timestamp = table_row.get_date_created_timestamp_for_update(update_enabled)
-            
-            date_created_item.setText(display_text)
-            date_created_item.setData(Qt.ItemDataRole.UserRole, timestamp)
-        
-        # Update row appearance to reflect any highlighting changes
-        self.update_row_appearance(visual_row)
-
+        # Row colors are read from the TableRows by the model while painting,
+        # so a single coalesced viewport update restyles every visible row
+        self.file_table.viewport().update()
+    
     def get_table_row_for_visual_row(self, visual_row: int) -> Optional['TableRow']:
         """Get the TableRow object for a given visual row in the table."""
-        if visual_row >= self.file_table.rowCount():
-            return None
-        
-        # Get the checkbox widget from the visual row
-        cell_widget = self.file_table.cellWidget(visual_row, 0)
-        if cell_widget:
-            checkbox_layout = cell_widget.layout()
-            if checkbox_layout and checkbox_layout.count() > 0:
-                layout_item = checkbox_layout.itemAt(0)
-                if layout_item:
-                    checkbox = layout_item.widget()
-                    if isinstance(checkbox, QCheckBox):
-                        return checkbox.property("table_row")
-        return None
+        return self.file_model.table_row(visual_row)
     
     def find_visual_row_for_table_row(self, target_table_row: 'TableRow') -> Optional[int]:
         """Find the current visual row index for a specific TableRow object."""
-        for row_idx in range(self.file_table.rowCount()):
-            table_row = self.get_table_row_for_visual_row(row_idx)
-            if table_row is target_table_row:
-                return row_idx
-        return None
+        return self.file_model.row_of(target_table_row)
     
     def update_row_appearance(self, row: int):
-        """Update the appearance of a table row based on its checkbox state and output tag selections."""
-        # Skip appearance updates during table population to avoid interfering with content display
-        if not self.file_table.isSortingEnabled():
-            return
-        
-        # Get the TableRow object for this visual row
-        table_row = self.get_table_row_for_visual_row(row)
-        if not table_row:
-            return
-        
-        is_checked = table_row.is_selected
-        
-        # Set colors based on checkbox state and content
-        palette = self.palette()
-        default_text = palette.color(QPalette.ColorRole.Text)
-        disabled_color = palette.color(QPalette.ColorRole.PlaceholderText)
-        default_bg = palette.color(QPalette.ColorRole.Base)
-        red_color = QColor(220, 20, 20) if not self._is_dark_theme() else QColor(255, 100, 100)
-        
-        for col in range(self.file_table.columnCount()):
-            item = self.file_table.item(row, col)
-            if item:
-                # Reset background to default
-                item.setBackground(default_bg)
-                
-                # Determine text color based on row selection and column content
-                if not is_checked:
-                    # Grey out non-selected files, but still make them visible
-                    item.setForeground(disabled_color)
-                else:
-                    # For checked files, determine color based on content and checkbox states
-                    should_be_red = False
-                    
-                    if col == 3:  # DateTimeOriginal column
-                        should_be_red = table_row.should_highlight_datetime_original(
-                            self.update_datetime_original_cb.isChecked()
-                        )
-                    elif col == 4:  # DateCreated column
-                        should_be_red = table_row.should_highlight_date_created(
-                            self.update_date_created_cb.isChecked()
-                        )
-                    
-                    # Apply the appropriate color
-                    if should_be_red:
-                        item.setForeground(red_color)
-                    else:
-                        item.setForeground(default_text)
+        """Redraw a table row so it reflects its checkbox state and output tag selections."""
+        # The model derives texts and colors from the TableRow whenever the row is redrawn
+        self.file_model.refresh_row(row)
+    
+    def _ensure_colors(self) -> Tuple[QColor, QColor, QColor]:
+        """Get the default, disabled and highlight text colors, reading the palette only once."""
+        if self._cached_colors is None:
+            palette = self.palette()
+            self._cached_colors = (
+                palette.color(QPalette.ColorRole.Text),
+                palette.color(QPalette.ColorRole.PlaceholderText),
+                _HIGHLIGHT_COLOR_DARK if self._is_dark_theme() else _HIGHLIGHT_COLOR_LIGHT
+            )
+        return self._cached_colors
+    
+    def _update_table_colors(self):
+        """Pass the text colors of the current palette to the table model."""
+        self.file_model.set_colors(*self._ensure_colors())
     
     def _is_dark_theme(self) -> bool:
         """Check if the current theme is dark."""
-        palette = self.palette()
-        window_color = palette.color(QPalette.ColorRole.Window)
-        # If the window background is darker than middle grey, assume dark theme
-        return window_color.lightness() < 128
+        if self._is_dark is None:
+            window_color = self.palette().color(QPalette.ColorRole.Window)
+            # If the window background is darker than middle grey, assume dark theme
+            self._is_dark = window_color.lightness() < 128
+        return self._is_dark
+    
+    def changeEvent(self, event):
+        """Drop the cached colors when the palette or theme changes."""
+        if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.ThemeChange):
+            self._cached_colors = None
+            self._is_dark = None
+            
+            # Palette changes can arrive before the table has been created
+            if hasattr(self, 'file_model'):
+                self._update_table_colors()
+                self.file_model.refresh_all([Qt.ItemDataRole.ForegroundRole])
+        super().changeEvent(event)
     
     def update_status_bar(self):
         """Update the status bar with current view information."""
-        if not self.table_rows:
+        if not self.media_files:
             self.status_bar.showMessage("Ready - Drop a folder here or use the Select Folder button")
             return
             
         # Get the current filtered row list
         rows_to_show = self.get_filtered_rows()
         filtered_count = len(rows_to_show)
-        total_files = len(self.table_rows)
+        total_files = len(self.media_files)
         
-        # Count selected files (from the current filtered view)
-        selected_count = sum(1 for row in rows_to_show if row.is_selected)
+        # Count selected and updatable files (from the current filtered view) in a single pass
+        selected_count = updatable_count = 0
+        for row in rows_to_show:
+            if row.is_selected:
+                selected_count += 1
+            if row.can_be_updated:
+                updatable_count += 1
         
         # Build status message based on current filters
         video_filter_text = " (Images Only)" if self.ignore_video_files_cb.isChecked() else ""
         
         if self.show_all_files_cb.isChecked():
-            updatable_count = sum(1 for row in rows_to_show if row.can_be_updated)
             self.status_bar.showMessage(f"Showing {filtered_count} of {total_files} files{video_filter_text}, {updatable_count} can be updated, {selected_count} selected")
         else:
             self.status_bar.showMessage(f"Showing {filtered_count} files with missing dates{video_filter_text} (total analyzed: {total_files}), {selected_count} selected")
     
+    def _refresh_all_date_columns(self):
+        """Redraw the date columns and highlighting after an output option was toggled."""
+        # Pass the options to the model once and redraw without rebuilding the rows
+        self.file_model.set_update_options(
+            self.update_datetime_original_cb.isChecked(),
+            self.update_date_created_cb.isChecked()
+        )
+        
+        # Rows sorted by a date column have to be reordered, as their sort keys changed
+        if self.file_model.sort_column in (MediaFileTableModel.DATETIME_ORIGINAL_COLUMN,
+                                           MediaFileTableModel.DATE_CREATED_COLUMN):
+            self.file_model.sort(self.file_model.sort_column, self.file_model.sort_order)
+        self.file_model.refresh_all()
+    
     def populate_file_table(self):
         """Populate the file table with analysis results."""
         rows_to_show = self.get_filtered_rows()
@@ -960,150 +895,23 @@ class ExifDateUpdaterGUI(QMainWindow):
             else:
                 self.table_group.setTitle("Files with Missing EXIF Dates")
         
-        self.file_table.setRowCount(len(rows_to_show))
-        
-        # Temporarily disable sorting while populating the table
-        self.file_table.setSortingEnabled(False)
-        
-        for row, table_row in enumerate(rows_to_show):
-            # Get a fresh checkbox from the TableRow
-            update_checkbox = table_row.checkbox
-            
-            # Connect the checkbox signal for this new checkbox
-            update_checkbox.stateChanged.connect(self._on_checkbox_changed_simple)
-            
-            # Center the checkbox in the cell
-            checkbox_widget = QWidget()
-            checkbox_layout = QHBoxLayout(checkbox_widget)
-            checkbox_layout.addWidget(update_checkbox)
-            checkbox_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            checkbox_layout.setContentsMargins(0, 0, 0, 0)
-            self.file_table.setCellWidget(row, 0, checkbox_widget)
-            
-            # Add hidden item with sort data for the checkbox column
-            checkbox_item = QTableWidgetItem()
-            # Use numeric values for reliable sorting: 1 for checked, 0 for unchecked
-            sort_value = 1 if update_checkbox.isChecked() else 0
-            checkbox_item.setData(Qt.ItemDataRole.UserRole, sort_value)
-            checkbox_item.setText(str(sort_value))  # Set text to numeric value for sorting
-            self.file_table.setItem(row, 0, checkbox_item)
-            
-            # Use TableRow properties for easier access to data
-            file = table_row.media_file
-            
-            # Filename
-            filename_item = QTableWidgetItem(table_row.filename)
-            filename_item.setToolTip(str(file.path))
-            self.file_table.setItem(row, 1, filename_item)
-            
-            # File Type - show the file extension
-            type_item = QTableWidgetItem(table_row.file_type)
-            type_item.setToolTip(f"File extension: {file.extension}")
-            self.file_table.setItem(row, 2, type_item)
-            
-            # DateTimeOriginal column (shifted to index 3)
-            datetime_original_item = QTableWidgetItem()
-            update_enabled = self.update_datetime_original_cb.isChecked()
-            display_text = table_row.get_datetime_original_for_update(update_enabled)
-            timestamp = table_row.get_datetime_original_timestamp_for_update(update_enabled)
-            
-            datetime_original_item.setText(display_text)
-            datetime_original_item.setData(Qt.ItemDataRole.UserRole, timestamp)
-            self.file_table.setItem(row, 3, datetime_original_item)
-            
-            # DateCreated column
-            date_created_item = QTableWidgetItem()
-            update_enabled = self.update_date_created_cb.isChecked()
-            display_text = table_row.get_date_created_for_update(update_enabled)
-            timestamp = table_row.get_date_created_timestamp_for_update(update_enabled)
-            
-            date_created_item.setText(display_text)
-            date_created_item.setData(Qt.ItemDataRole.UserRole, timestamp)
-            self.file_table.setItem(row, 4, date_created_item)
-            
-            # Source dropdown
-            if table_row.can_be_updated:
-                source_combo = NoScrollComboBox()
-                source_combo.setToolTip("Select the date source to use for this file")
-                
-                # Add all available sources to the dropdown
-                if table_row.has_available_sources:
-                    current_source_index = 0
-                    for idx, (date, source_name) in enumerate(file.available_sources):
-                        date_str_combo = date.strftime("%Y-%m-%d %H:%M:%S")
-                        display_text = f"{source_name} ({date_str_combo})"
-                        source_combo.addItem(display_text, (date, source_name))
-                        
-                        # Set current selection to the originally suggested source
-                        if hasattr(file, 'source') and source_name == file.source:
-                            current_source_index = idx
-                    
-                    # Add manual option at the end
-                    source_combo.addItem("Manual...", ("manual", "Manual"))
-                    source_combo.setCurrentIndex(current_source_index)
-                else:
-                    # Fallback if no available_sources but has suggested_date
-                    source = table_row.source_name
-                    source_combo.addItem(source, (file.suggested_date, source))
-                    source_combo.addItem("Manual...", ("manual", "Manual"))
-                
-                # Store reference in TableRow
-                table_row.source_combo = source_combo
-                
-                # Connect the combo box change event - use TableRow object to avoid row index issues after sorting
-                source_combo.currentIndexChanged.connect(
-                    lambda index, table_row=table_row: self.on_source_changed_by_table_row(table_row, index)
-                )
-                
-                self.file_table.setCellWidget(row, 5, source_combo)
-                
-                # Add hidden item for sorting by source name
-                source_sort_item = QTableWidgetItem(table_row.source_name)
-                source_sort_item.setData(Qt.ItemDataRole.UserRole, table_row.source_name)
-                self.file_table.setItem(row, 5, source_sort_item)
-            else:
-                # Source dropdown for files without any date options - still allow manual entry
-                source_combo = NoScrollComboBox()
-                source_combo.addItem("Manual...", ("manual", "Manual"))
-                source_combo.setToolTip("Manually enter a date and time for this file")
-                
-                # Store reference in TableRow
-                table_row.source_combo = source_combo
-                
-                # Connect the combo box change event - use TableRow object to avoid row index issues after sorting
-                source_combo.currentIndexChanged.connect(
-                    lambda index, table_row=table_row: self.on_source_changed_by_table_row(table_row, index)
-                )
-                
-                self.file_table.setCellWidget(row, 5, source_combo)
-                
-                # Add hidden item for sorting (empty sources sort to bottom)
-                empty_source_item = QTableWidgetItem("Manual")
-                empty_source_item.setData(Qt.ItemDataRole.UserRole, "Manual")
-                self.file_table.setItem(row, 5, empty_source_item)
-            
-            # File size
-            size_item = NumericTableWidgetItem(table_row.file_size_display, table_row.file_size)
-            size_item.setData(Qt.ItemDataRole.UserRole, table_row.file_size)
-            self.file_table.setItem(row, 6, size_item)
-        
-        # Re-enable sorting after table population is complete
-        self.file_table.setSortingEnabled(True)
+        # Output options and palette determine the displayed dates and their colors
+        self.file_model.set_update_options(
+            self.update_datetime_original_cb.isChecked(),
+            self.update_date_created_cb.isChecked()
+        )
+        self._update_table_colors()
         
-        # Now that sorting is enabled, update row appearances
-        for row in range(self.file_table.rowCount()):
-            self.update_row_appearance(row)
+        # Replace the rows in a single model reset, which keeps the current sort order;
+        # the view only requests visible cells.
+        # Painting is suspended so the reset and column resizing are redrawn only once
+        self.file_table.setUpdatesEnabled(False)
+        self.file_model.set_rows(rows_to_show)
+        self.file_table.setUpdatesEnabled(True)
         
         # Update status bar immediately
         self.update_status_bar()
     
-    def _update_all_row_appearances(self):
-        """Update the appearance of all rows after table population is complete."""
-        for row in range(self.file_table.rowCount()):
-            self.update_row_appearance(row)
-        # Force immediate GUI rendering
-        self.file_table.viewport().repaint()
-    
     def dry_run_update(self):
         """Start dry run update."""
         self.start_update(dry_run=True)
@@ -1124,36 +932,11 @@ class ExifDateUpdaterGUI(QMainWindow):
             self.start_update(dry_run=False)
     
     def update_all_checkbox_states(self):
-        """Update all visible checkbox states to match their TableRow is_selected values."""
-        for row_idx in range(self.file_table.rowCount()):
-            table_row = self.get_table_row_for_visual_row(row_idx)
-            if table_row:
-                cell_widget = self.file_table.cellWidget(row_idx, 0)
-                if cell_widget:
-                    checkbox_layout = cell_widget.layout()
-                    if checkbox_layout and checkbox_layout.count() > 0:
-                        layout_item = checkbox_layout.itemAt(0)
-                        if layout_item:
-                            checkbox = layout_item.widget()
-                            if isinstance(checkbox, QCheckBox):
-                                # Update checkbox state without triggering signals
-                                checkbox.blockSignals(True)
-                                checkbox.setChecked(table_row.is_selected)
-                                checkbox.blockSignals(False)
-                                
-                                # Update the sort data for the checkbox column
-                                checkbox_item = self.file_table.item(row_idx, 0)
-                                if checkbox_item:
-                                    sort_value = 1 if table_row.is_selected else 0
-                                    checkbox_item.setData(Qt.ItemDataRole.UserRole, sort_value)
-                                    checkbox_item.setText(str(sort_value))
-        
-        # Update row appearances, date columns, and status bar
-        for row in range(self.file_table.rowCount()):
-            self.update_row_appearance(row)
-            self.update_date_columns_for_row(row)
+        """Redraw all rows to match their TableRow is_selected values."""
+        # Checkboxes, date columns and colors are all derived from the TableRows by the model,
+        # so one dataChanged covers every row and schedules a single coalesced repaint
+        self.file_model.refresh_all()
         self.update_status_bar()
-        self.file_table.viewport().repaint()
 
     def select_all_files(self):
         """Select all files that can be updated."""
@@ -1198,13 +981,10 @@ class ExifDateUpdaterGUI(QMainWindow):
     
     def start_update(self, dry_run: bool = False):
         """Start update process in worker thread."""
-        # Sync all dropdown selections to MediaFile objects
-        self.sync_dropdown_selections()
-        
-        # Get only the selected files
+        # Get only the selected files (dropdown selections are applied to them as they are made)
         files_to_update = self.get_selected_files()
         
-        # Filter to only files that have date suggestions (after dropdown sync)
+        # Filter to only files that have date suggestions
         files_to_update = [f for f in files_to_update if f.suggested_date]
         
         if not files_to_update:
@@ -1229,15 +1009,6 @@ class ExifDateUpdaterGUI(QMainWindow):
         self.update_worker.error.connect(self.on_update_error)
         self.update_worker.start()
     
-    def sync_dropdown_selections(self):
-        """Sync all dropdown selections back to MediaFile objects using the new approach."""
-        rows_to_show = self.get_filtered_rows()
-        
-        for row_index, table_row in enumerate(rows_to_show):
-            combo = table_row.source_combo
-            if combo and combo.currentIndex() >= 0:
-                table_row.sync_from_combo_selection(combo.currentIndex())
-    
     def on_update_finished(self, successful: int, failed: int):
         """Handle update completion."""
         self.set_ui_enabled(True)
@@ -1281,7 +1052,7 @@ class ExifDateUpdaterGUI(QMainWindow):
         """Add message to log."""
         from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        self.log_text.appendPlainText(f"[{timestamp}] {message}")
         
         # Auto-scroll to bottom
         cursor = self.log_text.textCursor()
@@ -1314,19 +1085,28 @@ class ExifDateUpdaterGUI(QMainWindow):
         self.setStyleSheet("")
         
         if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.isLocalFile():
-                    file_path = Path(url.toLocalFile())
-                    if file_path.is_dir():
-                        # Set the dropped folder as the selected folder
-                        self.folder_path = file_path
-                        self.folder_label.setText(str(self.folder_path))
-                        self.folder_label.setStyleSheet("")  # Clear custom styling to use theme default
-                        self.analyze_btn.setEnabled(True)
-                        self.log(f"Folder dropped: {self.folder_path}")
-                        event.acceptProposedAction()
-                        return
+            paths = [Path(url.toLocalFile()) for url in event.mimeData().urls() if url.isLocalFile()]
+            if paths:
+                event.acceptProposedAction()
+                
+                # Resolve the dropped folder in the thread pool so slow file systems don't block the GUI
+                self.folder_scan_task = FolderScanTask(paths)
+                self.folder_scan_task.signals.finished.connect(self.on_folder_dropped)
+                QThreadPool.globalInstance().start(self.folder_scan_task)
+                return
         event.ignore()
+    
+    def on_folder_dropped(self, folder: Optional[Path]):
+        """Handle the folder resolved from a drop event."""
+        if folder is None:
+            return
+        
+        # Set the dropped folder as the selected folder
+        self.folder_path = folder
+        self.folder_label.setText(str(self.folder_path))
+        self.folder_label.setStyleSheet("")  # Clear custom styling to use theme default
+        self.analyze_btn.setEnabled(True)
+        self.log(f"Folder dropped: {self.folder_path}")
 
 
 def run_gui():
@@ -1335,18 +1115,9 @@ def run_gui():
     app.setApplicationName("EXIF Date Updater")
     app.setApplicationVersion("1.0")
     
-    # Set application icon for taskbar/system tray
+    # Set application icon for taskbar/system tray; the main window reuses the same cached icon
     try:
-        icons_dir = Path(__file__).parent / "resources" / "icons"
-        icon = QIcon()
-        icon_128_path = icons_dir / "logo_128.png"
-        icon_256_path = icons_dir / "logo_256.png"
-        
-        if icon_128_path.exists():
-            icon.addFile(str(icon_128_path))
-        if icon_256_path.exists():
-            icon.addFile(str(icon_256_path))
-            
+        icon = _app_icon()
         if not icon.isNull():
             app.setWindowIcon(icon)
     except Exception as e:
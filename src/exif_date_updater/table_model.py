@@ -0,0 +1,304 @@
+"""
+Table model for the file list of the EXIF Date Updater GUI.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QColor
+
+from .table_row import TableRow
+
+# Custom role returning the TableRow behind an index
+TableRowRole = Qt.ItemDataRole.UserRole
+
+# Custom role returning the source dropdown items of a row, see TableRow.source_options
+SourcesRole = Qt.ItemDataRole.UserRole + 1
+
+# Roles whose values change when a row is toggled or its source or output options change
+_REFRESH_ROLES = [
+    Qt.ItemDataRole.DisplayRole,
+    Qt.ItemDataRole.CheckStateRole,
+    Qt.ItemDataRole.ForegroundRole,
+]
+
+
+class MediaFileTableModel(QAbstractTableModel):
+    """Table model exposing TableRow objects to a QTableView.
+    
+    The TableRow list is the single source of truth; cells are produced on demand
+    in data() so only the visible rows are ever materialized by the view.
+    """
+    
+    COLUMN_HEADERS = ["Update", "Filename", "Type", "DateTimeOriginal", "DateCreated", "Source", "Size"]
+    COLUMN_TOOLTIPS = [
+        "Check to include this file in the update process",
+        "Filename",
+        "File type/extension",
+        "Current DateTimeOriginal EXIF value (empty if missing)",
+        "Current DateCreated EXIF value (empty if missing)",
+        "Select date source from available options",
+        "File size in bytes",
+    ]
+    
+    # Column indices
+    UPDATE_COLUMN = 0
+    FILENAME_COLUMN = 1
+    TYPE_COLUMN = 2
+    DATETIME_ORIGINAL_COLUMN = 3
+    DATE_CREATED_COLUMN = 4
+    SOURCE_COLUMN = 5
+    SIZE_COLUMN = 6
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[TableRow] = []
+        
+        # Model row of each TableRow, keyed by id() as TableRow is not hashable
+        self._row_index: Dict[int, int] = {}
+        
+        # Per-row style key (is_selected, highlight DateTimeOriginal, highlight DateCreated),
+        # computed on first paint and kept until the row is refreshed
+        self._style_keys: Dict[int, Tuple[bool, bool, bool]] = {}
+        
+        # Current sort column/order (-1 keeps the order the rows were given in)
+        self.sort_column = -1
+        self.sort_order = Qt.SortOrder.AscendingOrder
+        
+        # Output options that affect the displayed dates and highlighting
+        self.update_datetime_original = True
+        self.update_date_created = True
+        
+        # Text colors (None falls back to the view's default)
+        self._text_color: Optional[QColor] = None
+        self._disabled_color: Optional[QColor] = None
+        self._highlight_color: Optional[QColor] = None
+        
+        # Display text getter of each column, indexed by column number so data()
+        # dispatches in constant time instead of walking an if/elif chain per cell
+        self._display_getters: Tuple[Callable[[TableRow], Optional[str]], ...] = (
+            lambda table_row: None,
+            lambda table_row: table_row.filename,
+            lambda table_row: table_row.file_type,
+            lambda table_row: table_row.get_datetime_original_for_update(self.update_datetime_original),
+            lambda table_row: table_row.get_date_created_for_update(self.update_date_created),
+            lambda table_row: table_row.source_display,
+            lambda table_row: table_row.file_size_display,
+        )
+        
+        # Sort key getter of each column, returning a native int, float or str; the date
+        # columns use the timestamps TableRow computed once when it was created
+        self._sort_key_getters: Tuple[Callable[[TableRow], object], ...] = (
+            lambda table_row: 1 if table_row.is_selected else 0,
+            lambda table_row: table_row.filename,
+            lambda table_row: table_row.file_type,
+            lambda table_row: table_row.get_datetime_original_timestamp_for_update(self.update_datetime_original),
+            lambda table_row: table_row.get_date_created_timestamp_for_update(self.update_date_created),
+            lambda table_row: table_row.source_name if table_row.can_be_updated else "Manual",
+            lambda table_row: table_row.file_size,
+        )
+    
+    def set_rows(self, rows: List[TableRow]):
+        """Replace all rows of the model in a single reset, keeping the current sort order."""
+        self.beginResetModel()
+        self._rows = self._sorted(rows)
+        self._rebuild_row_index()
+        self._style_keys.clear()
+        self.endResetModel()
+    
+    def append_rows(self, rows: List[TableRow]):
+        """Append rows at the end of the model, e.g. while analysis results are still coming in.
+        
+        The appended rows are not sorted; sort() again once all rows were added.
+        """
+        if not rows:
+            return
+        
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        for row, table_row in enumerate(rows, first):
+            self._row_index[id(table_row)] = row
+        self.endInsertRows()
+    
+    def set_update_options(self, update_datetime_original: bool, update_date_created: bool):
+        """Set which EXIF dates will be written, as this changes the displayed values."""
+        self.update_datetime_original = update_datetime_original
+        self.update_date_created = update_date_created
+        self._style_keys.clear()
+    
+    def set_colors(self, text_color: QColor, disabled_color: QColor, highlight_color: QColor):
+        """Set the text colors used for selected, non-selected and highlighted cells."""
+        self._text_color = text_color
+        self._disabled_color = disabled_color
+        self._highlight_color = highlight_color
+    
+    def table_row(self, row: int) -> Optional[TableRow]:
+        """Get the TableRow at the given model row."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+    
+    def row_of(self, table_row: TableRow) -> Optional[int]:
+        """Get the model row of a TableRow, or None if it is not shown."""
+        return self._row_index.get(id(table_row))
+    
+    def _rebuild_row_index(self):
+        """Rebuild the TableRow to model row lookup after the rows were replaced or reordered."""
+        self._row_index = {id(table_row): row for row, table_row in enumerate(self._rows)}
+    
+    def refresh_row(self, row: int):
+        """Notify the view that all cells of a row need to be redrawn."""
+        self._style_keys.pop(id(self._rows[row]), None)
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.columnCount() - 1), _REFRESH_ROLES
+        )
+    
+    def refresh_all(self, roles: Optional[List[int]] = None):
+        """Notify the view that all cells need to be redrawn, with one signal for the whole table."""
+        self._style_keys.clear()
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._rows) - 1, self.columnCount() - 1),
+                _REFRESH_ROLES if roles is None else roles
+            )
+    
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        """Sort the rows by a column, comparing native Python keys instead of display text."""
+        self.sort_column = column
+        self.sort_order = order
+        if column < 0 or not self._rows:
+            return
+        
+        self.layoutAboutToBeChanged.emit()
+        
+        # Remember which TableRow each persistent index (selection, open editor) points at
+        persistent = self.persistentIndexList()
+        persistent_rows = [self._rows[index.row()] for index in persistent]
+        
+        self._rows = self._sorted(self._rows)
+        self._rebuild_row_index()
+        
+        self.changePersistentIndexList(persistent, [
+            self.index(self._row_index[id(table_row)], index.column())
+            for table_row, index in zip(persistent_rows, persistent)
+        ])
+        self.layoutChanged.emit()
+    
+    def _sorted(self, rows: List[TableRow]) -> List[TableRow]:
+        """Return the rows ordered by the current sort column, keeping ties stable."""
+        if self.sort_column < 0:
+            return list(rows)
+        
+        # The column's key getter is picked once per sort; sorted() then evaluates it exactly
+        # once per row and compares the resulting ints, floats or strings natively
+        return sorted(
+            rows,
+            key=self._sort_key_getters[self.sort_column],
+            reverse=self.sort_order == Qt.SortOrder.DescendingOrder
+        )
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMN_HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.COLUMN_HEADERS[section]
+            if role == Qt.ItemDataRole.ToolTipRole:
+                return self.COLUMN_TOOLTIPS[section]
+        return super().headerData(section, orientation, role)
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.UPDATE_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        elif index.column() == self.SOURCE_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        table_row = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_getters[column](table_row)
+        
+        if role == Qt.ItemDataRole.CheckStateRole:
+            if column == self.UPDATE_COLUMN:
+                return Qt.CheckState.Checked if table_row.is_selected else Qt.CheckState.Unchecked
+            return None
+        
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._foreground(table_row, column)
+        
+        if role == Qt.ItemDataRole.ToolTipRole:
+            if column == self.UPDATE_COLUMN:
+                return "Check to include this file in the update"
+            elif column == self.FILENAME_COLUMN:
+                return str(table_row.media_file.path)
+            elif column == self.TYPE_COLUMN:
+                return f"File extension: {table_row.media_file.extension}"
+            elif column == self.SOURCE_COLUMN:
+                if table_row.can_be_updated:
+                    return "Select the date source to use for this file"
+                return "Manually enter a date and time for this file"
+            return None
+        
+        if role == TableRowRole:
+            return table_row
+        
+        if role == SourcesRole:
+            if column == self.SOURCE_COLUMN:
+                return table_row.source_options()
+            return None
+        
+        return None
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if (not index.isValid() or index.column() != self.UPDATE_COLUMN
+                or role != Qt.ItemDataRole.CheckStateRole):
+            return False
+        
+        # The TableRow notifies the GUI of the change, which refreshes the row
+        table_row = self._rows[index.row()]
+        table_row.is_selected = Qt.CheckState(value) == Qt.CheckState.Checked
+        return True
+    
+    def _style_key(self, table_row: TableRow) -> Tuple[bool, bool, bool]:
+        """Get the cached style key of a row, evaluating the highlight rules only once per refresh."""
+        key = self._style_keys.get(id(table_row))
+        if key is None:
+            key = (
+                table_row.is_selected,
+                table_row.should_highlight_datetime_original(self.update_datetime_original),
+                table_row.should_highlight_date_created(self.update_date_created),
+            )
+            self._style_keys[id(table_row)] = key
+        return key
+    
+    def _foreground(self, table_row: TableRow, column: int) -> Optional[QColor]:
+        """Get the text color of a cell based on its row's checkbox state and output options."""
+        is_selected, highlight_datetime_original, highlight_date_created = self._style_key(table_row)
+        
+        # Grey out non-selected files, but still make them visible
+        if not is_selected:
+            return self._disabled_color
+        
+        # Highlight dates that will be written
+        if column == self.DATETIME_ORIGINAL_COLUMN and highlight_datetime_original:
+            return self._highlight_color
+        if column == self.DATE_CREATED_COLUMN and highlight_date_created:
+            return self._highlight_color
+        
+        return self._text_color
@@ -2,34 +2,91 @@
 Table row data structure for the EXIF Date Updater GUI.
 """
 
-from dataclasses import dataclass
-from typing import Optional, Callable
-from datetime import datetime
+from dataclasses import dataclass, field
+from typing import List, Optional, Callable, Tuple
+from datetime import datetime, timedelta
 
-from PySide6.QtWidgets import QCheckBox, QComboBox
-from .exif_analyzer import MediaFile
+from .exif_analyzer import ExifAnalyzer, MediaFile
 
+# Dates closer together than this are treated as equal when deciding what to highlight
+_DATE_TOLERANCE = timedelta(seconds=1)
 
-@dataclass
+
+def _iso_fmt(d: datetime) -> str:
+    """Format a datetime as "YYYY-MM-DD HH:MM:SS" for display."""
+    # Plain integer formatting avoids strftime's per-call locale handling
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}:{d.second:02d}"
+
+
+def _state_field(default=None):
+    """Declare a field of internal row state, which is no __init__ argument and not in repr or ==."""
+    return field(default=default, init=False, repr=False, compare=False)
+
+
+@dataclass(slots=True)
 class TableRow:
-    """Represents a single row in the file table with all associated data and widgets."""
+    """Represents a single row in the file table with all associated data.
+    
+    Uses __slots__, so every value derived from the MediaFile is stored in a
+    declared field and filled in by __post_init__ or refresh_suggested; only
+    media_file is an __init__ argument and part of repr and comparisons.
+    """
     
     # Core data
     media_file: MediaFile
     
-    # UI widgets (created on demand)
-    _source_combo: Optional[QComboBox] = None
+    # Date entered through the manual date dialog, kept to offer it again in the dropdown
+    _manual_date: Optional[datetime] = _state_field(None)
     
     # Cached properties
-    _is_selected: bool = False
+    _is_selected: bool = _state_field(False)
+    
+    # Display text and timestamp of each MediaFile date, formatted once in __post_init__
+    # (the suggested date is reformatted by refresh_suggested when it changes)
+    _dt_original_str: str = _state_field("")
+    _dt_original_ts: float = _state_field(0.0)
+    _date_created_str: str = _state_field("")
+    _date_created_ts: float = _state_field(0.0)
+    _suggested_str: str = _state_field("")
+    _suggested_ts: float = _state_field(0.0)
+    
+    # Whether the suggested date differs from each existing date (or that date is missing)
+    _differs_dt_original: bool = _state_field(False)
+    _differs_date_created: bool = _state_field(False)
+    
+    # Values that only depend on data which doesn't change for a row, set in __post_init__
+    _filename: str = _state_field("")
+    _file_type: str = _state_field("")
+    _file_size_display: str = _state_field("")
+    _has_missing_dates: bool = _state_field(False)
+    _has_available_sources: bool = _state_field(False)
+    _is_video_file: bool = _state_field(False)
+    
+    # Values derived from the suggested date and source, set in refresh_suggested
+    _source_name: str = _state_field("")
+    _has_suggested_date: bool = _state_field(False)
+    _can_be_updated: bool = _state_field(False)
     
     # Callback for notifying the GUI of changes
-    _update_callback: Optional[Callable[['TableRow'], None]] = None
+    _update_callback: Optional[Callable[['TableRow'], None]] = _state_field(None)
     
     def __post_init__(self):
         """Initialize derived properties after dataclass creation."""
         # Initially select files that have missing dates and can be updated
         self._is_selected = bool(self.media_file.missing_dates and self.media_file.suggested_date)
+        
+        file = self.media_file
+        self._filename = file.name
+        self._file_type = file.extension.lstrip('.').upper()
+        self._file_size_display = f"{file.size:,} bytes"
+        self._has_missing_dates = bool(file.missing_dates)
+        self._has_available_sources = bool(file.available_sources)
+        self._is_video_file = file.extension.lower() in ExifAnalyzer.VIDEO_EXTENSIONS
+        
+        # The existing EXIF dates never change for a row, so format them only once
+        self._dt_original_str, self._dt_original_ts = self._format_date(self.media_file.datetime_original)
+        self._date_created_str, self._date_created_ts = self._format_date(self.media_file.date_created)
+        self.refresh_suggested()
     
     def set_update_callback(self, callback: Callable[['TableRow'], None]):
         """Set the callback function to be called when the row needs to be updated."""
@@ -40,28 +97,39 @@ class TableRow:
         if self._update_callback:
             self._update_callback(self)
     
-    @property
-    def checkbox(self) -> QCheckBox:
-        """Create a new checkbox widget for this row."""
-        # Always create a new checkbox to avoid Qt widget lifecycle issues
-        checkbox = QCheckBox()
-        checkbox.setChecked(self._is_selected)
-        checkbox.setToolTip("Check to include this file in the update")
-        checkbox.setProperty("table_row", self)
-        # Note: Signal connection will be handled by the main GUI class
-        return checkbox
-    
-    @property
-    def source_combo(self) -> Optional[QComboBox]:
-        """Get the source combo widget for this row (may be None if no sources available)."""
-        return self._source_combo
-    
-    @source_combo.setter
-    def source_combo(self, combo: QComboBox):
-        """Set the source combo widget for this row."""
-        self._source_combo = combo
-        if combo:
-            combo.setProperty("table_row", self)
+    @staticmethod
+    def _format_date(date: Optional[datetime]) -> Tuple[str, float]:
+        """Get the display text and timestamp of a date (empty and 0 if missing)."""
+        if date:
+            return _iso_fmt(date), date.timestamp()
+        return "", 0.0
+    
+    def refresh_suggested(self):
+        """Recompute everything derived from the suggested date and source after they changed."""
+        file = self.media_file
+        suggested = file.suggested_date
+        self._suggested_str, self._suggested_ts = self._format_date(suggested)
+        
+        # Compare the datetimes directly with a small tolerance; a missing date always differs
+        self._differs_dt_original = (
+            not file.datetime_original or suggested is None
+            or abs(file.datetime_original - suggested) > _DATE_TOLERANCE
+        )
+        self._differs_date_created = (
+            not file.date_created or suggested is None
+            or abs(file.date_created - suggested) > _DATE_TOLERANCE
+        )
+        
+        # MediaFile always defines source, but it stays None when no date was suggested;
+        # then the first available source is the one the dropdown preselects
+        if file.source:
+            self._source_name = file.source
+        elif file.available_sources:
+            self._source_name = file.available_sources[0][1]
+        else:
+            self._source_name = 'Unknown'
+        self._has_suggested_date = bool(suggested)
+        self._can_be_updated = self._has_suggested_date or self._has_available_sources
     
     @property
     def is_selected(self) -> bool:
@@ -78,12 +146,12 @@ class TableRow:
     @property
     def filename(self) -> str:
         """Get the filename for display."""
-        return self.media_file.name
+        return self._filename
     
     @property
     def file_type(self) -> str:
         """Get the file type/extension for display."""
-        return self.media_file.extension.lstrip('.').upper()
+        return self._file_type
     
     @property
     def file_size(self) -> int:
@@ -93,158 +161,171 @@ class TableRow:
     @property
     def file_size_display(self) -> str:
         """Get the file size formatted for display."""
-        return f"{self.media_file.size:,} bytes"
+        return self._file_size_display
     
     @property
     def datetime_original_display(self) -> str:
         """Get the DateTimeOriginal value for display."""
-        if self.media_file.datetime_original:
-            return self.media_file.datetime_original.strftime("%Y-%m-%d %H:%M:%S")
-        return ""
+        return self._dt_original_str
     
     @property
     def datetime_original_timestamp(self) -> float:
         """Get the DateTimeOriginal timestamp for sorting (0 if empty)."""
-        if self.media_file.datetime_original:
-            return self.media_file.datetime_original.timestamp()
-        return 0.0
+        return self._dt_original_ts
     
     @property
     def date_created_display(self) -> str:
         """Get the DateCreated value for display."""
-        if self.media_file.date_created:
-            return self.media_file.date_created.strftime("%Y-%m-%d %H:%M:%S")
-        return ""
+        return self._date_created_str
     
     @property
     def date_created_timestamp(self) -> float:
         """Get the DateCreated timestamp for sorting (0 if empty)."""
-        if self.media_file.date_created:
-            return self.media_file.date_created.timestamp()
-        return 0.0
+        return self._date_created_ts
+    
+    @property
+    def suggested_date_display(self) -> str:
+        """Get the suggested date for display."""
+        return self._suggested_str
     
     @property
     def source_name(self) -> str:
         """Get the current source name for display and sorting."""
-        return getattr(self.media_file, 'source', 'Unknown')
+        return self._source_name
+    
+    @property
+    def source_display(self) -> str:
+        """Get the selected source and its date for display in the source column."""
+        if self.media_file.suggested_date:
+            return f"{self.source_name} ({self.suggested_date_display})"
+        if self.can_be_updated:
+            return self.source_name
+        return "Manual..."
     
     @property
     def has_missing_dates(self) -> bool:
         """Check if this file has missing EXIF dates."""
-        return bool(self.media_file.missing_dates)
+        return self._has_missing_dates
     
     @property
     def has_suggested_date(self) -> bool:
         """Check if this file has a suggested date available."""
-        return bool(self.media_file.suggested_date)
+        return self._has_suggested_date
     
     @property
     def has_available_sources(self) -> bool:
         """Check if this file has available date sources."""
-        return bool(hasattr(self.media_file, 'available_sources') and self.media_file.available_sources)
+        return self._has_available_sources
     
     @property
     def can_be_updated(self) -> bool:
         """Check if this file can be updated (has sources or suggested date)."""
-        return self.has_suggested_date or self.has_available_sources
+        return self._can_be_updated
     
     @property
     def is_video_file(self) -> bool:
         """Check if this is a video file."""
-        from .exif_analyzer import ExifAnalyzer
-        return self.media_file.extension.lower() in ExifAnalyzer.VIDEO_EXTENSIONS
+        return self._is_video_file
     
     def get_datetime_original_for_update(self, update_enabled: bool) -> str:
         """Get the DateTimeOriginal display value based on actual file data and selection state."""
         # If file is selected for update and we have a suggested date, show that (will be red if different)
         if self.is_selected and update_enabled and self.media_file.suggested_date:
-            return self.media_file.suggested_date.strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Otherwise show actual file data if it exists
-        if self.media_file.datetime_original:
-            return self.media_file.datetime_original.strftime("%Y-%m-%d %H:%M:%S")
+            return self._suggested_str
         
-        # Otherwise show nothing
-        return ""
+        # Otherwise show actual file data (empty if it doesn't exist)
+        return self._dt_original_str
     
     def get_datetime_original_timestamp_for_update(self, update_enabled: bool) -> float:
         """Get the DateTimeOriginal timestamp for sorting."""
         # If file is selected for update and we have a suggested date, use that for sorting
         if self.is_selected and update_enabled and self.media_file.suggested_date:
-            return self.media_file.suggested_date.timestamp()
+            return self._suggested_ts
         
-        # Otherwise use actual file data if it exists
-        if self.media_file.datetime_original:
-            return self.media_file.datetime_original.timestamp()
-        
-        return 0.0
+        # Otherwise use actual file data (0 if it doesn't exist)
+        return self._dt_original_ts
     
     def get_date_created_for_update(self, update_enabled: bool) -> str:
         """Get the DateCreated display value based on actual file data and selection state."""
         # If file is selected for update and we have a suggested date, show that (will be red if different)
         if self.is_selected and update_enabled and self.media_file.suggested_date:
-            return self.media_file.suggested_date.strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Otherwise show actual file data if it exists
-        if self.media_file.date_created:
-            return self.media_file.date_created.strftime("%Y-%m-%d %H:%M:%S")
+            return self._suggested_str
         
-        # Otherwise show nothing
-        return ""
+        # Otherwise show actual file data (empty if it doesn't exist)
+        return self._date_created_str
     
     def get_date_created_timestamp_for_update(self, update_enabled: bool) -> float:
         """Get the DateCreated timestamp for sorting."""
         # If file is selected for update and we have a suggested date, use that for sorting
         if self.is_selected and update_enabled and self.media_file.suggested_date:
-            return self.media_file.suggested_date.timestamp()
+            return self._suggested_ts
         
-        # Otherwise use actual file data if it exists
-        if self.media_file.date_created:
-            return self.media_file.date_created.timestamp()
-        
-        return 0.0
+        # Otherwise use actual file data (0 if it doesn't exist)
+        return self._date_created_ts
     
     def should_highlight_datetime_original(self, update_enabled: bool) -> bool:
         """Determine if DateTimeOriginal column should be highlighted in red."""
-        # Only highlight if file is selected for update and we have a suggested date
-        if not (self.is_selected and update_enabled and self.media_file.suggested_date):
-            return False
-        
-        # Highlight if no existing data (will write new data)
-        if not self.media_file.datetime_original:
-            return True
-        
-        # Highlight if suggested date is different from existing data (will overwrite)
-        existing_timestamp = self.media_file.datetime_original.timestamp()
-        suggested_timestamp = self.media_file.suggested_date.timestamp()
-        # Allow small tolerance for timestamp comparison (1 second)
-        return abs(existing_timestamp - suggested_timestamp) > 1.0
+        # Only highlight if file is selected for update and we have a suggested date that
+        # will write new data or overwrite a different existing value
+        return (self._is_selected and update_enabled
+                and self.media_file.suggested_date is not None and self._differs_dt_original)
     
     def should_highlight_date_created(self, update_enabled: bool) -> bool:
         """Determine if DateCreated column should be highlighted in red."""
-        # Only highlight if file is selected for update and we have a suggested date
-        if not (self.is_selected and update_enabled and self.media_file.suggested_date):
-            return False
-        
-        # Highlight if no existing data (will write new data)
-        if not self.media_file.date_created:
-            return True
-        
-        # Highlight if suggested date is different from existing data (will overwrite)
-        existing_timestamp = self.media_file.date_created.timestamp()
-        suggested_timestamp = self.media_file.suggested_date.timestamp()
-        # Allow small tolerance for timestamp comparison (1 second)
-        return abs(existing_timestamp - suggested_timestamp) > 1.0
+        # Only highlight if file is selected for update and we have a suggested date that
+        # will write new data or overwrite a different existing value
+        return (self._is_selected and update_enabled
+                and self.media_file.suggested_date is not None and self._differs_date_created)
     
     def sync_from_combo_selection(self, combo_index: int):
-        """Update the MediaFile based on the current combo box selection."""
-        if self._source_combo and combo_index >= 0:
-            date, source_name = self._source_combo.itemData(combo_index)
+        """Update the MediaFile based on a selection in the source dropdown."""
+        options, _ = self.source_options()
+        if 0 <= combo_index < len(options):
+            date, source_name = options[combo_index][1]
             if isinstance(date, datetime):
                 self.media_file.suggested_date = date
                 self.media_file.source = source_name
+                self.refresh_suggested()
                 self._notify_update()  # Notify GUI that this row needs updating
     
+    def set_manual_date(self, manual_date: datetime):
+        """Use a manually entered date as the suggested date and notify the GUI."""
+        self._manual_date = manual_date
+        self.media_file.suggested_date = manual_date
+        self.media_file.source = "Manual"
+        self.refresh_suggested()
+        self._notify_update()  # Notify GUI that this row needs updating
+    
+    def source_options(self) -> Tuple[List[Tuple[str, tuple]], int]:
+        """Get the source dropdown items as (display text, (date, source name)) and the index to select."""
+        file = self.media_file
+        options = []
+        current_source_index = 0
+        
+        if self.has_available_sources:
+            # Add all available sources to the dropdown
+            for idx, (date, source_name) in enumerate(file.available_sources):
+                options.append((f"{source_name} ({_iso_fmt(date)})", (date, source_name)))
+                
+                # Set current selection to the originally suggested source
+                if source_name == file.source:
+                    current_source_index = idx
+        elif self.has_suggested_date and file.source != "Manual":
+            # Fallback if no available_sources but has suggested_date
+            source = self.source_name
+            options.append((source, (file.suggested_date, source)))
+        
+        # Manual entry comes last (files without any date options only allow manual entry),
+        # showing a previously entered manual date so it can be selected again
+        if file.source == "Manual":
+            current_source_index = len(options)
+        if self._manual_date is not None:
+            options.append((f"Manual ({_iso_fmt(self._manual_date)})", (self._manual_date, "Manual")))
+        else:
+            options.append(("Manual...", ("manual", "Manual")))
+        
+        return options, current_source_index
+    
     def __str__(self) -> str:
         """String representation for debugging."""
         return f"TableRow({self.filename}, selected={self.is_selected}, missing={self.has_missing_dates})"
@@ -1,5 +1,7 @@
 """Test runner for all EXIF Date Updater tests."""
 
+import importlib.util
+import os
 import unittest
 import sys
 from pathlib import Path
@@ -8,9 +10,26 @@ from pathlib import Path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
 
+# Add the project root too, the test modules import their helpers from tests.test_utils
+sys.path.insert(0, str(src_path.parent))
+
 def discover_and_run_tests():
     """Discover and run all tests."""
     
+    # Prefer pytest with pytest-xdist when installed, which collects and runs
+    # the test modules in parallel worker processes
+    if importlib.util.find_spec('pytest') and importlib.util.find_spec('xdist'):
+        import pytest
+        
+        # loadscope keeps each test class on one worker, so setUpClass fixtures are shared
+        args = ['-n', 'auto', '--dist', 'loadscope', str(Path(__file__).parent)]
+        
+        # Set EXIF_TESTS_LAST_FAILED=1 to only rerun the tests that failed last time
+        if os.environ.get('EXIF_TESTS_LAST_FAILED'):
+            args.insert(0, '--lf')
+        
+        return pytest.main(args) == 0
+    
     # Discover tests
     loader = unittest.TestLoader()
     start_dir = str(Path(__file__).parent)
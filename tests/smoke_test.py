@@ -51,7 +51,6 @@ def test_date_pattern_matching():
     
     try:
         from exif_date_updater import ExifAnalyzer
-        import re
         
         analyzer = ExifAnalyzer()
         
@@ -65,7 +64,7 @@ def test_date_pattern_matching():
         for filename, should_match in test_cases:
             found_match = False
             for pattern in analyzer.DATE_PATTERNS:
-                if re.search(pattern, filename):
+                if pattern.search(filename):
                     found_match = True
                     break
             
@@ -52,11 +52,9 @@ class TestExifAnalyzer(unittest.TestCase):
                 
                 # We'll test the pattern matching logic indirectly
                 # by checking if our patterns would match
-                import re
-                
                 found_date = None
                 for pattern in self.analyzer.DATE_PATTERNS:
-                    match = re.search(pattern, filename)
+                    match = pattern.search(filename)
                     if match:
                         try:
                             groups = match.groups()
@@ -131,6 +129,26 @@ class TestExifAnalyzer(unittest.TestCase):
                 self.assertGreater(file.confidence, 0,
                                  f"File {file.name} should have confidence > 0")
     
+    def test_parse_exif_datetime(self):
+        """Test parsing of EXIF datetime strings."""
+        test_cases = [
+            ("2023:12:15 14:20:30", datetime(2023, 12, 15, 14, 20, 30)),
+            ("2023:1:5 4:02:03", datetime(2023, 1, 5, 4, 2, 3)),
+            ("2023:13:15 14:20:30", None),
+            ("2023-12-15 14:20:30", None),
+            ("    :  :     :  :  ", None),
+            ("2023:12:15 14:20:+5", None),
+            ("2023:12:15 14:20: 3", None),
+            ("2_23:12:15 14:20:30", None),
+            ("2023:12:15 14:-0:30", None),
+            ("", None),
+            (None, None),
+        ]
+        
+        for date_str, expected in test_cases:
+            with self.subTest(date_str=date_str):
+                self.assertEqual(self.analyzer._parse_exif_datetime(date_str), expected)
+    
     def test_analyze_nonexistent_folder(self):
         """Test analyzing a non-existent folder."""
         nonexistent_path = Path("/this/path/does/not/exist")
@@ -1,43 +1,49 @@
 """Tests for the ExifUpdater module."""
 
+import os
 import unittest
-import tempfile
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 from exif_date_updater import ExifUpdater
 from exif_date_updater.exif_analyzer import MediaFile
-from tests.test_utils import create_test_image
+from tests.test_utils import create_stub_file, create_test_image, temporary_directory
 
 
 class TestExifUpdater(unittest.TestCase):
     """Test cases for ExifUpdater class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root directory shared by all tests."""
+        cls._root_handle = temporary_directory()
+        # Class cleanups also run when setUpClass or the tests fail
+        cls.addClassCleanup(cls._root_handle.cleanup)
+        cls._root = Path(cls._root_handle.name)
+    
     def setUp(self):
         """Set up test fixtures."""
         self.updater = ExifUpdater(create_backup=True)
-        self.temp_dir = None
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if self.temp_dir and Path(self.temp_dir).exists():
-            import shutil
-            shutil.rmtree(self.temp_dir)
     
     def create_temp_dir(self):
-        """Create a temporary directory for testing."""
-        self.temp_dir = tempfile.mkdtemp()
-        return Path(self.temp_dir)
+        """Get the temporary directory of the current test, inside the shared root."""
+        temp_dir = self._root / self._testMethodName
+        temp_dir.mkdir(exist_ok=True)
+        return temp_dir
     
     def create_test_media_file(self, filename: str, suggested_date: Optional[datetime], 
-                              missing_dates: list, confidence: float = 0.7) -> MediaFile:
-        """Create a test MediaFile object."""
+                              missing_dates: list, confidence: float = 0.7,
+                              stub: bool = False) -> MediaFile:
+        """Create a test MediaFile object (stub: the file content is never read)."""
         temp_dir = self.create_temp_dir()
         file_path = temp_dir / filename
         
-        # Create actual image file
-        create_test_image(file_path)
+        # Create actual image file, or only a placeholder if the test never reads it
+        if stub:
+            create_stub_file(file_path)
+        else:
+            create_test_image(file_path)
         
         # Create MediaFile object
         media_file = MediaFile(file_path)
@@ -63,7 +69,8 @@ class TestExifUpdater(unittest.TestCase):
         media_file = self.create_test_media_file(
             "test_image.jpg",
             datetime(2023, 12, 15, 14, 20, 30),
-            ["DateTimeOriginal", "DateCreated"]
+            ["DateTimeOriginal", "DateCreated"],
+            stub=True
         )
         
         # Get original file modification time
@@ -77,28 +84,25 @@ class TestExifUpdater(unittest.TestCase):
         self.assertEqual(media_file.path.stat().st_mtime, original_mtime)
         self.assertEqual(len(self.updater.updated_files), 0)
     
-    def test_update_file_without_suggestion(self):
-        """Test updating a file without a suggested date."""
-        media_file = self.create_test_media_file(
-            "test_image.jpg",
-            None,  # No suggested date
-            ["DateTimeOriginal"]
-        )
-        media_file.suggested_date = None
-        
-        success = self.updater.update_file_dates(media_file)
-        self.assertFalse(success)
-    
-    def test_update_file_without_missing_dates(self):
-        """Test updating a file with no missing dates."""
-        media_file = self.create_test_media_file(
-            "test_image.jpg",
-            datetime(2023, 12, 15, 14, 20, 30),
-            []  # No missing dates
-        )
+    def test_update_fails(self):
+        """Test updating files without a suggestion, without missing dates or of unsupported format."""
+        suggested_date = datetime(2023, 12, 15, 14, 20, 30)
+        cases = [
+            # (filename, suggested_date, missing_dates, stub)
+            ("without_suggestion.jpg", None, ["DateTimeOriginal"], True),
+            ("without_missing_dates.jpg", suggested_date, [], False),
+            ("unsupported_format.mp4", suggested_date, ["DateTimeOriginal"], True),
+        ]
         
-        success = self.updater.update_file_dates(media_file)
-        self.assertFalse(success)
+        # Each case uses its own filename, so the cases share the test directory
+        for filename, suggested, missing_dates, stub in cases:
+            with self.subTest(filename=filename):
+                media_file = self.create_test_media_file(
+                    filename, suggested, missing_dates, stub=stub
+                )
+                
+                success = self.updater.update_file_dates(media_file, dry_run=False)
+                self.assertFalse(success)
     
     def test_backup_creation(self):
         """Test that backup files are created."""
@@ -115,6 +119,25 @@ class TestExifUpdater(unittest.TestCase):
         backup_path = media_file.path.with_suffix(media_file.path.suffix + '.backup')
         self.assertTrue(backup_path.exists(), "Backup file should be created")
     
+    def test_hardlink_backup_keeps_original(self):
+        """Test that a hard-linked backup keeps the original content after an update."""
+        updater = ExifUpdater(create_backup=True, backup_mode='hardlink')
+        media_file = self.create_test_media_file(
+            "test_image.jpg",
+            datetime(2023, 12, 15, 14, 20, 30),
+            ["DateTimeOriginal"]
+        )
+        original_content = media_file.path.read_bytes()
+        
+        self.assertTrue(updater.update_file_dates(media_file, dry_run=False))
+        
+        backup_path = media_file.path.with_suffix(media_file.path.suffix + '.backup')
+        self.assertEqual(backup_path.read_bytes(), original_content)
+        self.assertNotEqual(media_file.path.read_bytes(), original_content)
+        
+        with self.assertRaises(ValueError):
+            ExifUpdater(backup_mode='symlink')
+    
     def test_multiple_backup_handling(self):
         """Test handling of multiple backups."""
         media_file = self.create_test_media_file(
@@ -133,6 +156,24 @@ class TestExifUpdater(unittest.TestCase):
         backup_path_1 = media_file.path.with_suffix(media_file.path.suffix + '.backup.1')
         self.assertTrue(backup_path_1.exists(), "Second backup should be .backup.1")
     
+    def test_backup_after_manual_removal(self):
+        """Test that a new backup gets the plain name again after the backups were removed."""
+        media_file = self.create_test_media_file(
+            "test_image.jpg",
+            datetime(2023, 12, 15, 14, 20, 30),
+            ["DateTimeOriginal"]
+        )
+        backup_path = media_file.path.with_suffix(media_file.path.suffix + '.backup')
+        
+        # First update, then remove its backup outside of cleanup_backups
+        self.updater.update_file_dates(media_file, dry_run=False)
+        backup_path.unlink()
+        
+        # The next backup must be restorable again
+        self.updater.update_file_dates(media_file, dry_run=False)
+        self.assertTrue(backup_path.exists(), "Backup should use the plain .backup name")
+        self.assertTrue(self.updater.restore_backup(media_file.path))
+    
     def test_restore_backup(self):
         """Test restoring a file from backup."""
         media_file = self.create_test_media_file(
@@ -147,8 +188,12 @@ class TestExifUpdater(unittest.TestCase):
         # Update file
         self.updater.update_file_dates(media_file, dry_run=False)
         
-        # Modify the file to simulate changes
-        media_file.path.write_text("modified content")
+        # Modify the file to simulate changes, overwriting it with raw bytes
+        fd = os.open(media_file.path, os.O_WRONLY | os.O_TRUNC)
+        try:
+            os.write(fd, b"modified content")
+        finally:
+            os.close(fd)
         
         # Restore from backup
         success = self.updater.restore_backup(media_file.path)
@@ -178,7 +223,7 @@ class TestExifUpdater(unittest.TestCase):
         backup_file = temp_dir / "test.jpg.backup"
         backup_file_1 = temp_dir / "test.jpg.backup.1"
         
-        create_test_image(test_file)
+        create_stub_file(test_file)
         backup_file.write_text("backup 1")
         backup_file_1.write_text("backup 2")
         
@@ -190,6 +235,27 @@ class TestExifUpdater(unittest.TestCase):
         self.assertFalse(backup_file_1.exists())
         self.assertTrue(test_file.exists())  # Original should remain
     
+    def test_update_multiple_files_keeps_order(self):
+        """Test that concurrently updated files are reported in the input order."""
+        media_files = [
+            self.create_test_media_file(
+                f"test_image_{i}.jpg",
+                datetime(2023, 12, 1 + i, 14, 20, 30),
+                ["DateTimeOriginal"]
+            )
+            for i in range(8)
+        ]
+        
+        progress = []
+        successful, failed = self.updater.update_multiple_files(
+            media_files, dry_run=False, max_workers=4,
+            progress_callback=lambda media_file, success: progress.append((media_file, success))
+        )
+        
+        self.assertEqual((successful, failed), (8, 0))
+        self.assertEqual(self.updater.updated_files, [media_file.path for media_file in media_files])
+        self.assertEqual(progress, [(media_file, True) for media_file in media_files])
+    
     def test_update_multiple_files(self):
         """Test updating multiple files."""
         media_files = [
@@ -207,17 +273,6 @@ class TestExifUpdater(unittest.TestCase):
         
         self.assertEqual(successful, 3)
         self.assertEqual(failed, 0)
-    
-    def test_unsupported_file_format(self):
-        """Test updating unsupported file format."""
-        media_file = self.create_test_media_file(
-            "test_video.mp4",  # Unsupported for EXIF updates
-            datetime(2023, 12, 15, 14, 20, 30),
-            ["DateTimeOriginal"]
-        )
-        
-        success = self.updater.update_file_dates(media_file, dry_run=False)
-        self.assertFalse(success)
 
 
 if __name__ == '__main__':
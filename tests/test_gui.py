@@ -0,0 +1,136 @@
+"""Tests for the GUI of the EXIF Date Updater."""
+
+import os
+import time
+import unittest
+from pathlib import Path
+from datetime import datetime
+
+# Run without a display, unless a platform was chosen explicitly
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+
+from exif_date_updater.exif_analyzer import MediaFile
+from exif_date_updater.gui import ExifDateUpdaterGUI, UpdateWorker
+from exif_date_updater.table_model import MediaFileTableModel
+from tests.test_utils import create_stub_file, temporary_directory
+
+
+class TestManualSourceSelection(unittest.TestCase):
+    """Test entering a manual date through the source dropdown."""
+    
+    SUGGESTED_DATE = datetime(2023, 12, 15, 14, 20, 30)
+    MANUAL_DATE = datetime(2024, 1, 2, 3, 4, 5)
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create the QApplication shared by all tests."""
+        cls.app = QApplication.instance() or QApplication([])
+    
+    def setUp(self):
+        """Show a window with one analyzed file in the table."""
+        self.window = ExifDateUpdaterGUI()
+        self.addCleanup(self.window.deleteLater)
+        self.window.show()
+        
+        self.media_file = MediaFile(Path("IMG_20231215_142030.jpg"))
+        self.media_file.missing_dates = ["DateTimeOriginal"]
+        self.media_file.available_sources = [(self.SUGGESTED_DATE, "Filename")]
+        self.media_file.suggested_date = self.SUGGESTED_DATE
+        self.media_file.source = "Filename"
+        
+        self.window.media_files = [self.media_file]
+        self.window.populate_file_table()
+        self.source_index = self.window.file_model.index(0, MediaFileTableModel.SOURCE_COLUMN)
+    
+    def select_manual_source(self, accept: bool):
+        """Pick "Manual..." in the source dropdown and accept or cancel the dialog."""
+        # Making the source cell current opens its dropdown
+        table = self.window.file_table
+        table.setCurrentIndex(self.source_index)
+        self.app.processEvents()
+        combo = table.indexWidget(self.source_index)
+        self.assertIsNotNone(combo, "Source dropdown should be open")
+        
+        dialog_closed = []
+        
+        def close_dialog():
+            dialog = QApplication.activeModalWidget()
+            if dialog is None:
+                # The dialog is opened from the event loop after the dropdown was closed
+                QTimer.singleShot(10, close_dialog)
+                return
+            if accept:
+                dialog.datetime_edit.setDateTime(self.MANUAL_DATE)
+                dialog.accept()
+            else:
+                dialog.reject()
+            dialog_closed.append(True)
+        
+        QTimer.singleShot(10, close_dialog)
+        combo.setCurrentIndex(combo.count() - 1)
+        
+        deadline = time.monotonic() + 5
+        while not dialog_closed and time.monotonic() < deadline:
+            self.app.processEvents()
+        self.app.processEvents()
+        self.assertTrue(dialog_closed, "Manual date dialog should have been shown")
+    
+    def test_accept_manual_date(self):
+        """Test that an accepted manual date becomes the row's source."""
+        self.select_manual_source(accept=True)
+        
+        self.assertEqual(self.media_file.source, "Manual")
+        self.assertEqual(self.media_file.suggested_date, self.MANUAL_DATE)
+        self.assertEqual(self.source_index.data(), "Manual (2024-01-02 03:04:05)")
+        
+        # The reopened dropdown offers the manual date
+        options, current_index = self.window.file_model.table_row(0).source_options()
+        self.assertEqual(options[current_index], ("Manual (2024-01-02 03:04:05)", (self.MANUAL_DATE, "Manual")))
+    
+    def test_cancel_manual_date(self):
+        """Test that cancelling the manual date dialog keeps the previous source."""
+        self.select_manual_source(accept=False)
+        
+        self.assertEqual(self.media_file.source, "Filename")
+        self.assertEqual(self.media_file.suggested_date, self.SUGGESTED_DATE)
+        self.assertEqual(self.source_index.data(), "Filename (2023-12-15 14:20:30)")
+
+
+class TestUpdateWorker(unittest.TestCase):
+    """Test the worker thread running the updates."""
+    
+    def test_dry_run_reports_files_in_order(self):
+        """Test that the worker logs the files in the order they were given."""
+        temp_dir_handle = temporary_directory()
+        self.addCleanup(temp_dir_handle.cleanup)
+        temp_dir = Path(temp_dir_handle.name)
+        
+        media_files = []
+        for i in range(6):
+            media_file_path = temp_dir / f"test_image_{i}.jpg"
+            create_stub_file(media_file_path)
+            media_file = MediaFile(media_file_path)
+            media_file.missing_dates = ["DateTimeOriginal"]
+            media_file.suggested_date = datetime(2023, 12, 1 + i, 14, 20, 30)
+            media_file.source = "Filename"
+            media_files.append(media_file)
+        
+        worker = UpdateWorker(media_files, True, True, create_backup=False, dry_run=True)
+        messages = []
+        results = []
+        worker.progress.connect(messages.append)
+        worker.finished.connect(lambda successful, failed: results.append((successful, failed)))
+        
+        # Run in this thread, the signals are then delivered directly
+        worker.run()
+        
+        self.assertEqual(results, [(6, 0)])
+        logged = [line for message in messages[1:] for line in message.split("\n")]
+        self.assertEqual(logged, [f"Simulated: {media_file.name}" for media_file in media_files])
+
+
+if __name__ == '__main__':
+    unittest.main()
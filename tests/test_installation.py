@@ -1,5 +1,6 @@
 """Installation verification test."""
 
+import importlib.util
 import unittest
 import sys
 from pathlib import Path
@@ -57,10 +58,9 @@ class TestInstallation(unittest.TestCase):
         
         for module_name in required_modules:
             with self.subTest(module=module_name):
-                try:
-                    __import__(module_name)
-                except ImportError as e:
-                    self.fail(f"Required dependency {module_name} not available: {e}")
+                # Only locate the module, without running its import side effects
+                self.assertIsNotNone(importlib.util.find_spec(module_name),
+                                     f"Required dependency {module_name} not available")
     
     def test_package_structure(self):
         """Test that the package structure is correct."""
@@ -10,9 +10,14 @@ from tests.test_utils import TestFileManager
 class TestIntegration(unittest.TestCase):
     """Integration tests for the complete workflow."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create the test files once; tests that modify files work on a copy."""
+        cls.shared_dir = cls.enterClassContext(TestFileManager())
+    
     def test_complete_workflow(self):
         """Test the complete analyze -> update workflow."""
-        with TestFileManager() as temp_dir:
+        with TestFileManager(source_dir=self.shared_dir) as temp_dir:
             # Step 1: Analyze files
             analyzer = ExifAnalyzer()
             media_files = analyzer.analyze_folder(temp_dir)
@@ -54,63 +59,59 @@ class TestIntegration(unittest.TestCase):
     
     def test_analyzer_statistics(self):
         """Test that analyzer statistics are correctly calculated."""
-        with TestFileManager() as temp_dir:
-            analyzer = ExifAnalyzer()
-            media_files = analyzer.analyze_folder(temp_dir)
-            
-            # Verify statistics match actual results
-            self.assertEqual(analyzer.stats['total_files'], len(media_files))
-            
-            # Count actual image and video files
-            actual_image_count = sum(1 for f in media_files 
-                                   if f.extension in analyzer.IMAGE_EXTENSIONS)
-            actual_video_count = sum(1 for f in media_files 
-                                   if f.extension in analyzer.VIDEO_EXTENSIONS)
-            
-            self.assertEqual(analyzer.stats['image_files'], actual_image_count)
-            self.assertEqual(analyzer.stats['video_files'], actual_video_count)
-            
-            # Count files with missing dates
-            actual_missing_original = sum(1 for f in media_files 
-                                        if not f.datetime_original)
-            actual_missing_created = sum(1 for f in media_files 
-                                       if not f.date_created)
-            
-            self.assertEqual(analyzer.stats['missing_datetime_original'], 
-                           actual_missing_original)
-            self.assertEqual(analyzer.stats['missing_date_created'], 
-                           actual_missing_created)
-            
-            # Count files with suggestions
-            actual_with_suggestions = sum(1 for f in media_files 
-                                        if f.suggested_date)
-            
-            self.assertEqual(analyzer.stats['files_with_suggestions'], 
-                           actual_with_suggestions)
+        # Analysis only reads the files, so the shared directory is used directly
+        analyzer = ExifAnalyzer()
+        media_files = analyzer.analyze_folder(self.shared_dir)
+        
+        # Verify statistics match actual results
+        self.assertEqual(analyzer.stats['total_files'], len(media_files))
+        
+        # Count actual image and video files, missing dates and suggestions in one pass
+        actual_image_count = actual_video_count = 0
+        actual_missing_original = actual_missing_created = actual_with_suggestions = 0
+        for f in media_files:
+            if f.extension in analyzer.IMAGE_EXTENSIONS:
+                actual_image_count += 1
+            elif f.extension in analyzer.VIDEO_EXTENSIONS:
+                actual_video_count += 1
+            if not f.datetime_original:
+                actual_missing_original += 1
+            if not f.date_created:
+                actual_missing_created += 1
+            if f.suggested_date:
+                actual_with_suggestions += 1
+        
+        self.assertEqual(analyzer.stats['image_files'], actual_image_count)
+        self.assertEqual(analyzer.stats['video_files'], actual_video_count)
+        self.assertEqual(analyzer.stats['missing_datetime_original'], 
+                       actual_missing_original)
+        self.assertEqual(analyzer.stats['missing_date_created'], 
+                       actual_missing_created)
+        self.assertEqual(analyzer.stats['files_with_suggestions'], 
+                       actual_with_suggestions)
     
     def test_confidence_prioritization(self):
         """Test that date sources are prioritized by confidence."""
-        with TestFileManager() as temp_dir:
-            analyzer = ExifAnalyzer()
-            media_files = analyzer.analyze_folder(temp_dir)
-            
-            suggested_files = analyzer.get_files_with_suggestions()
-            
-            for file in suggested_files:
-                # Files with filename dates should have 0.7 confidence
-                if file.filename_date and not file.datetime_original:
-                    self.assertEqual(file.confidence, 0.7,
-                                   f"Filename date should have 0.7 confidence for {file.name}")
-                
-                # Files with modification dates should have lower confidence
-                if (not file.filename_date and not file.datetime_original and 
-                    file.modification_date):
-                    self.assertLessEqual(file.confidence, 0.5,
-                                       f"Modification date should have ≤0.5 confidence for {file.name}")
+        analyzer = ExifAnalyzer()
+        analyzer.analyze_folder(self.shared_dir)
+        
+        suggested_files = analyzer.get_files_with_suggestions()
+        
+        for file in suggested_files:
+            # Files with filename dates should have 0.7 confidence
+            if file.filename_date and not file.datetime_original:
+                self.assertEqual(file.confidence, 0.7,
+                               f"Filename date should have 0.7 confidence for {file.name}")
+            
+            # Files with modification dates should have lower confidence
+            if (not file.filename_date and not file.datetime_original and 
+                file.modification_date):
+                self.assertLessEqual(file.confidence, 0.5,
+                                   f"Modification date should have ≤0.5 confidence for {file.name}")
     
     def test_backup_and_restore_workflow(self):
         """Test the complete backup and restore workflow."""
-        with TestFileManager() as temp_dir:
+        with TestFileManager(source_dir=self.shared_dir) as temp_dir:
             # Analyze and get files to update
             analyzer = ExifAnalyzer()
             analyzer.analyze_folder(temp_dir)
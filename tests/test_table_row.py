@@ -0,0 +1,87 @@
+"""Tests for the TableRow module."""
+
+import unittest
+from pathlib import Path
+from datetime import datetime
+
+from exif_date_updater.exif_analyzer import MediaFile
+from exif_date_updater.table_row import TableRow
+
+
+class TestTableRow(unittest.TestCase):
+    """Test cases for TableRow class."""
+    
+    def create_media_file(self) -> MediaFile:
+        """Create a MediaFile with missing dates (the file itself doesn't need to exist)."""
+        media_file = MediaFile(Path("IMG_20231215_142030.jpg"))
+        media_file.missing_dates = ["DateTimeOriginal", "DateCreated"]
+        return media_file
+    
+    def test_internal_fields_are_not_arguments(self):
+        """Test that only media_file is an __init__ argument and compared."""
+        media_file = self.create_media_file()
+        with self.assertRaises(TypeError):
+            TableRow(media_file, _is_selected=True)
+        
+        row = TableRow(media_file)
+        other_row = TableRow(media_file)
+        other_row.is_selected = not row.is_selected
+        self.assertEqual(row, other_row)
+    
+    def test_source_with_suggested_date(self):
+        """Test that the suggested source and date are shown."""
+        media_file = self.create_media_file()
+        media_file.suggested_date = datetime(2023, 12, 15, 14, 20, 30)
+        media_file.source = "Filename"
+        media_file.available_sources = [(media_file.suggested_date, "Filename")]
+        
+        row = TableRow(media_file)
+        self.assertEqual(row.source_name, "Filename")
+        self.assertEqual(row.source_display, "Filename (2023-12-15 14:20:30)")
+    
+    def test_source_without_suggested_date(self):
+        """Test that the first available source is shown when no date was suggested."""
+        media_file = self.create_media_file()
+        media_file.available_sources = [
+            (datetime(2023, 12, 15, 14, 20, 30), "File Modified"),
+            (datetime(2023, 12, 16, 9, 0, 0), "File Created"),
+        ]
+        
+        row = TableRow(media_file)
+        self.assertEqual(row.source_name, "File Modified")
+        self.assertEqual(row.source_display, "File Modified")
+        
+        # The dropdown preselects the same source
+        options, current_index = row.source_options()
+        self.assertEqual(options[current_index][1][1], "File Modified")
+    
+    def test_manual_date_stays_selectable(self):
+        """Test that an entered manual date is still offered after switching to another source."""
+        media_file = self.create_media_file()
+        media_file.available_sources = [(datetime(2023, 12, 15, 14, 20, 30), "Filename")]
+        manual_date = datetime(2024, 1, 2, 3, 4, 5)
+        
+        row = TableRow(media_file)
+        row.set_manual_date(manual_date)
+        self.assertEqual(media_file.source, "Manual")
+        self.assertEqual(row.source_display, "Manual (2024-01-02 03:04:05)")
+        
+        options, current_index = row.source_options()
+        self.assertEqual(current_index, 1)
+        self.assertEqual(options[1], ("Manual (2024-01-02 03:04:05)", (manual_date, "Manual")))
+        
+        # Switch back to the filename date; the manual date remains in the dropdown
+        row.sync_from_combo_selection(0)
+        options, current_index = row.source_options()
+        self.assertEqual((current_index, media_file.source), (0, "Filename"))
+        self.assertEqual(options[1][1], (manual_date, "Manual"))
+    
+    def test_source_without_any_sources(self):
+        """Test that files without any date source only offer manual entry."""
+        row = TableRow(self.create_media_file())
+        self.assertEqual(row.source_name, "Unknown")
+        self.assertEqual(row.source_display, "Manual...")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,12 @@
 """Test utilities for creating test images and data."""
 
+import os
+import shutil
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -8,6 +14,75 @@ from PIL import Image
 import piexif
 
 
+# Free space /dev/shm needs to be used for test files, as it is RAM shared with the system
+_SHM_MIN_FREE_BYTES = 64 * 1024 * 1024
+
+
+def _test_temp_root() -> Optional[str]:
+    """Get the RAM-backed /dev/shm for test files on Linux, or None for tempfile's default."""
+    # An explicit TMPDIR is always respected
+    if not sys.platform.startswith('linux') or 'TMPDIR' in os.environ:
+        return None
+    
+    shm = '/dev/shm'
+    try:
+        if (os.path.isdir(shm) and os.access(shm, os.W_OK)
+                and shutil.disk_usage(shm).free >= _SHM_MIN_FREE_BYTES):
+            return shm
+    except OSError:
+        pass
+    return None
+
+
+_TEST_TEMP_ROOT = _test_temp_root()
+
+
+def temporary_directory() -> tempfile.TemporaryDirectory:
+    """
+    Create a temporary directory for test files, on /dev/shm when it is usable.
+    
+    The prefix makes directories left behind by a killed test run easy to find.
+    
+    Returns:
+        TemporaryDirectory to clean up (or use as a context manager)
+    """
+    return tempfile.TemporaryDirectory(prefix='exif_date_updater_tests_', dir=_TEST_TEMP_ROOT)
+
+
+def _encode_base_jpeg() -> bytes:
+    """Encode the simple red test image as JPEG."""
+    buffer = BytesIO()
+    Image.new('RGB', (100, 100), color='red').save(buffer, format='JPEG')
+    return buffer.getvalue()
+
+
+# Every test image has the same pixels, so they are encoded only once
+_BASE_JPEG_BYTES = _encode_base_jpeg()
+
+# JFIF header without any image data, enough for files whose content is never decoded
+_STUB_JPEG_BYTES = b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00\xff\xd9'
+
+
+@lru_cache(maxsize=64)
+def _exif_bytes_for(exif_date_str: str) -> bytes:
+    """Build the EXIF data of a test image with the given date, once per date."""
+    exif_dict = {
+        "0th": {},
+        "Exif": {
+            piexif.ExifIFD.DateTimeOriginal: exif_date_str,
+            piexif.ExifIFD.DateTimeDigitized: exif_date_str,
+        },
+        "GPS": {},
+        "1st": {},
+        "thumbnail": None
+    }
+    
+    # Add DateTime to main IFD
+    exif_dict["0th"][piexif.ImageIFD.DateTime] = exif_date_str
+    
+    return piexif.dump(exif_dict)
+
+
 def create_test_image(path: Path, add_exif: bool = False, exif_date: Optional[datetime] = None) -> None:
     """
     Create a simple test image, optionally with EXIF data.
@@ -17,31 +92,27 @@ def create_test_image(path: Path, add_exif: bool = False, exif_date: Optional[da
         add_exif: Whether to add EXIF data
         exif_date: Date to add to EXIF (if add_exif is True)
     """
-    # Create a simple red image
-    img = Image.new('RGB', (100, 100), color='red')
-    
     if add_exif and exif_date:
         # Create EXIF data with the specified date
-        exif_date_str = exif_date.strftime('%Y:%m:%d %H:%M:%S')
-        
-        exif_dict = {
-            "0th": {},
-            "Exif": {
-                piexif.ExifIFD.DateTimeOriginal: exif_date_str,
-                piexif.ExifIFD.DateTimeDigitized: exif_date_str,
-            },
-            "GPS": {},
-            "1st": {},
-            "thumbnail": None
-        }
-        
-        # Add DateTime to main IFD
-        exif_dict["0th"][piexif.ImageIFD.DateTime] = exif_date_str
+        exif_bytes = _exif_bytes_for(exif_date.strftime('%Y:%m:%d %H:%M:%S'))
         
-        exif_bytes = piexif.dump(exif_dict)
-        img.save(path, format='JPEG', exif=exif_bytes)
+        # Splice the EXIF segment into the pre-encoded image instead of re-encoding it
+        output = BytesIO()
+        piexif.insert(exif_bytes, _BASE_JPEG_BYTES, output)
+        path.write_bytes(output.getvalue())
     else:
-        img.save(path, format='JPEG')
+        # Write the pre-encoded simple red image
+        path.write_bytes(_BASE_JPEG_BYTES)
+
+
+def create_stub_file(path: Path) -> None:
+    """
+    Create a minimal JPEG (start and end markers only) for tests that never read the image.
+    
+    Args:
+        path: Path where to save the file
+    """
+    path.write_bytes(_STUB_JPEG_BYTES)
 
 
 def create_test_directory() -> Path:
@@ -51,8 +122,23 @@ def create_test_directory() -> Path:
     Returns:
         Path to the temporary directory
     """
-    temp_dir = Path(tempfile.mkdtemp())
+    temp_dir = Path(tempfile.mkdtemp(prefix='exif_date_updater_tests_', dir=_TEST_TEMP_ROOT))
+    try:
+        populate_test_directory(temp_dir)
+    except BaseException:
+        # Don't leave a half-filled directory behind, nobody else knows about it
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+    return temp_dir
+
+
+def populate_test_directory(temp_dir: Path) -> None:
+    """
+    Fill a directory with various test files.
     
+    Args:
+        temp_dir: Existing directory to create the test files in
+    """
     # Test files with different filename patterns
     test_files = [
         ("IMG_20231215_142030.jpg", False, None),  # Date in filename, no EXIF
@@ -63,31 +149,53 @@ def create_test_directory() -> Path:
         ("2023-12-25_christmas.jpg", False, None), # ISO date format
     ]
     
-    for filename, has_exif, exif_date in test_files:
-        create_test_image(temp_dir / filename, has_exif, exif_date)
-    
-    return temp_dir
+    # Write the files concurrently, the GIL is released while their bytes are written
+    with ThreadPoolExecutor(max_workers=min(4, len(test_files))) as executor:
+        list(executor.map(
+            lambda test_file: create_test_image(temp_dir / test_file[0], test_file[1], test_file[2]),
+            test_files
+        ))
 
 
 class TestFileManager:
-    """Context manager for handling test directories."""
+    """Context manager for handling test directories.
     
-    def __init__(self):
+    Args:
+        source_dir: Existing test directory to copy the files from, instead of
+            creating them anew (e.g. one shared by the tests of a class)
+    """
+    
+    # Not a test class, despite the Test prefix pytest collects
+    __test__ = False
+    
+    def __init__(self, source_dir: Optional[Path] = None):
+        self.source_dir = source_dir
         self.temp_dir = None
+        self._temp_dir_handle = None
     
     def __enter__(self):
-        self.temp_dir = create_test_directory()
+        self._temp_dir_handle = temporary_directory()
+        self.temp_dir = Path(self._temp_dir_handle.name)
+        try:
+            if self.source_dir:
+                shutil.copytree(self.source_dir, self.temp_dir, dirs_exist_ok=True)
+            else:
+                populate_test_directory(self.temp_dir)
+        except BaseException:
+            # __exit__ is not called when __enter__ fails, so clean up here
+            self._temp_dir_handle.cleanup()
+            raise
         return self.temp_dir
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.temp_dir and self.temp_dir.exists():
-            import shutil
-            shutil.rmtree(self.temp_dir)
+        if self._temp_dir_handle:
+            self._temp_dir_handle.cleanup()
 
 
+@lru_cache(maxsize=1)
 def get_sample_files():
-    """Get a list of sample filenames for testing date pattern recognition."""
-    return [
+    """Get the sample filenames for testing date pattern recognition, built once as a tuple."""
+    return (
         "IMG_20231215_142030.jpg",      # Should detect: 2023-12-15 14:20:30
         "photo_without_date.jpg",       # Should detect: None
         "20231201_vacation.jpg",        # Should detect: 2023-12-01 00:00:00
@@ -98,4 +206,4 @@ def get_sample_files():
         "random_file.jpg",              # Should detect: None
         "31-12-2023_newyear.jpg",      # Should detect: 2023-12-31 00:00:00
         "holiday_25122023.jpg",         # Should detect: 2023-12-25 00:00:00
-    ]
+    )